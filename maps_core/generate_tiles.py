@@ -30,24 +30,233 @@ Usage:
     
     # With custom local image file
     python3 generate_tiles.py seitenbuch --image /path/to/image.png
+    
+    # Stream the whole pyramid through libvips (requires pyvips)
+    python3 generate_tiles.py everon --backend vips
 """
 
 import argparse
 import json
-import math
+import os
 import shutil
 import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
 from pathlib import Path
 from io import BytesIO
+from itertools import chain
 
+import numpy as np
 import requests
 from PIL import Image
 
+try:
+    import pyvips
+except ImportError:
+    pyvips = None
+
+try:
+    import webp
+except ImportError:
+    webp = None
+
+try:
+    import torch
+    import torch.nn.functional as F
+except ImportError:
+    torch = None
+
 # Disable decompression bomb protection for large game maps
 Image.MAX_IMAGE_PIXELS = None
 
 TILE_SIZE = 256
 WEBP_QUALITY = 90  # 0-100, higher = better quality but larger files
+WEBP_METHOD = 4  # 0-6 encoder effort; 4 gives near method-6 sizes at 2-3x the speed
+WEBP_LOSSLESS_QUALITY = 0  # Lossless effort; flat tiles compress well even at the fastest setting
+WEBP_LOSSLESS_METHOD = 3
+LOSSLESS_MAX_COLORS = 32  # Tiles with fewer distinct colors are encoded losslessly
+SHARED_COPY_ROWS = 1024  # Rows copied per band when filling the shared-memory level buffer
+GPU_BAND_ROWS = 256  # Output rows downscaled per band on the GPU, bounding the float32 working copy
+GPU_BAND_OVERLAP = 4  # Extra output rows per band edge, covering the antialiased bicubic support
+WRITER_THREADS = 4  # Threads writing encoded tiles to disk
+MAX_PENDING_WRITES = 256  # Encoded tiles allowed to wait for a writer thread
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MB reads keep per-chunk Python overhead negligible
+PROGRESS_INTERVAL = 0.25  # Seconds between download progress updates
+
+def _encode_black_tile():
+    """Encode one all-black tile so empty tiles can be written without running the encoder."""
+    buffer = BytesIO()
+    Image.new('RGB', (TILE_SIZE, TILE_SIZE), (0, 0, 0)).save(
+        buffer, 'WEBP', lossless=True, quality=WEBP_LOSSLESS_QUALITY, method=WEBP_LOSSLESS_METHOD)
+    return buffer.getvalue()
+
+BLACK_TILE_WEBP = _encode_black_tile()
+
+# Per-worker view of the zoom level currently being tiled (set by _init_tile_worker)
+_worker_shm = None
+_worker_level = None
+_worker_scratch = None  # Reusable TILE_SIZE x TILE_SIZE buffer for padding edge tiles
+_worker_webp_config = None  # libwebp encoder settings when the webp package is installed
+_worker_webp_lossless_config = None
+
+def _init_tile_worker(shm_name, shape):
+    """Attach a tile-encoding worker process to the shared zoom level buffer.
+    
+    Args:
+        shm_name: Name of the SharedMemory block holding the scaled image
+        shape: (height, width, 3) shape of the RGB pixel array
+    """
+    global _worker_shm, _worker_level, _worker_scratch, _worker_webp_config, _worker_webp_lossless_config
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_level = np.ndarray(shape, dtype=np.uint8, buffer=_worker_shm.buf)
+    _worker_scratch = np.zeros((TILE_SIZE, TILE_SIZE, 3), dtype=np.uint8)
+    if webp is not None:
+        _worker_webp_config = webp.WebPConfig.new(quality=WEBP_QUALITY, method=WEBP_METHOD)
+        _worker_webp_lossless_config = webp.WebPConfig.new(
+            quality=WEBP_LOSSLESS_QUALITY, lossless=True, method=WEBP_LOSSLESS_METHOD)
+
+def _encode_tile(job):
+    """Crop, pad and WebP-encode a single tile from the shared zoom level buffer.
+    
+    Args:
+        job: (x1, y1, x2, y2) pixel bounds of the tile in the scaled image
+        
+    Returns:
+        bytes: Encoded WebP tile, written to disk by the parent's writer threads
+    """
+    x1, y1, x2, y2 = job
+    tile_arr = _worker_level[y1:y2, x1:x2]  # zero-copy view
+    
+    # If tile is smaller than TILE_SIZE, pad it with black in the reusable
+    # scratch buffer, clearing only what the previous edge tile may have left
+    tile_height, tile_width = y2 - y1, x2 - x1
+    if (tile_height, tile_width) != (TILE_SIZE, TILE_SIZE):
+        _worker_scratch[tile_height:, :] = 0
+        _worker_scratch[:tile_height, tile_width:] = 0
+        _worker_scratch[:tile_height, :tile_width] = tile_arr
+        tile_arr = _worker_scratch
+    
+    # Flat, low-color tiles (coastline, padding edges) are smaller and much
+    # faster to encode losslessly than with the lossy encoder
+    lossless = _is_low_color(tile_arr)
+    
+    # Call libwebp directly when available, skipping PIL's image wrapper
+    if _worker_webp_config is not None:
+        config = _worker_webp_lossless_config if lossless else _worker_webp_config
+        picture = webp.WebPPicture.from_numpy(np.ascontiguousarray(tile_arr))
+        return bytes(picture.encode(config).buffer())
+    
+    buffer = BytesIO()
+    if lossless:
+        Image.fromarray(tile_arr).save(buffer, 'WEBP', lossless=True,
+                                       quality=WEBP_LOSSLESS_QUALITY, method=WEBP_LOSSLESS_METHOD)
+    else:
+        Image.fromarray(tile_arr).save(buffer, 'WEBP', quality=WEBP_QUALITY, method=WEBP_METHOD)
+    return buffer.getvalue()
+
+def _is_low_color(tile_arr):
+    """Check whether a tile uses fewer than LOSSLESS_MAX_COLORS distinct colors.
+    
+    Args:
+        tile_arr: (TILE_SIZE, TILE_SIZE, 3) uint8 pixel array
+        
+    Returns:
+        bool: True if the tile should be encoded losslessly
+    """
+    # Reject typical satellite tiles on a sparse sample before counting every pixel
+    for sample in (tile_arr[::8, ::8], tile_arr):
+        packed = (sample[..., 0].astype(np.uint32) << 16) | (sample[..., 1].astype(np.uint32) << 8) | sample[..., 2]
+        if np.unique(packed).size >= LOSSLESS_MAX_COLORS:
+            return False
+    return True
+
+def _tile_content_mask(level, cols, rows):
+    """Compute which tiles of a zoom level contain any non-black pixel.
+    
+    Args:
+        level: (height, width, 3) uint8 pixel array of the scaled image
+        cols: Number of tile columns
+        rows: Number of tile rows
+        
+    Returns:
+        np.ndarray: (rows, cols) boolean mask, True where the tile has content
+    """
+    width = level.shape[1]
+    mask = np.zeros((rows, cols), dtype=bool)
+    column_has_content = np.zeros(cols * TILE_SIZE, dtype=bool)
+    # Reduce one row of tiles at a time so the temporary stays at TILE_SIZE x width
+    for row in range(rows):
+        band = level[row * TILE_SIZE:(row + 1) * TILE_SIZE]
+        column_has_content[:width] = band.any(axis=(0, 2))
+        mask[row] = column_has_content.reshape(cols, TILE_SIZE).any(axis=1)
+    return mask
+
+def _existing_tile_rows(col_dir):
+    """List the rows of non-empty tiles already written to a tile column directory.
+    
+    Args:
+        col_dir: Path of a {zoom}/{x} tile column directory
+        
+    Returns:
+        list: Row numbers (y) of existing .webp tiles with a non-zero size
+    """
+    existing_rows = []
+    with os.scandir(col_dir) as entries:
+        for entry in entries:
+            row, ext = os.path.splitext(entry.name)
+            if ext == '.webp' and row.isdigit() and entry.stat().st_size > 0:
+                existing_rows.append(int(row))
+    return existing_rows
+
+def _write_tile(tile_path, data):
+    """Write an encoded tile under a temporary name and rename it into place.
+    
+    Args:
+        tile_path: Destination {zoom}/{x}/{y}.webp path
+        data: Encoded WebP bytes
+        
+    Note:
+        An interrupted write leaves only a .tmp file, which resume ignores
+        and the next run overwrites, never a truncated .webp.
+    """
+    tmp_path = tile_path.with_name(tile_path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, tile_path)
+
+def _image_size(image):
+    """Return (width, height) of a PIL image or a (height, width, 3) pixel array."""
+    if isinstance(image, np.ndarray):
+        return image.shape[1], image.shape[0]
+    return image.size
+
+def _image_rows(image, y, y2):
+    """Return rows y to y2 of a PIL image or a (height, width, 3) pixel array as a uint8 array."""
+    if isinstance(image, np.ndarray):
+        return image[y:y2]
+    return np.asarray(image.crop((0, y, image.size[0], y2)))
+
+def _copy_to_shared_memory(image):
+    """Copy an RGB image into a new SharedMemory block in bounded row bands.
+    
+    Args:
+        image: PIL.Image in RGB mode, or (height, width, 3) uint8 array such
+            as the padded-cache memory map
+        
+    Returns:
+        SharedMemory: Block holding the (height, width, 3) uint8 pixel array;
+        the caller must close() and unlink() it
+    """
+    width, height = _image_size(image)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, width * height * 3))
+    level = np.ndarray((height, width, 3), dtype=np.uint8, buffer=shm.buf)
+    for y in range(0, height, SHARED_COPY_ROWS):
+        y2 = min(y + SHARED_COPY_ROWS, height)
+        level[y:y2] = _image_rows(image, y, y2)
+    del level
+    return shm
 
 def download_image(url):
     """Download image from URL with progress tracking.
@@ -60,7 +269,9 @@ def download_image(url):
         
     Note:
         Displays download progress as percentage and file size in GB.
-        Handles large files (2.6GB+) with streaming download.
+        Handles large files (2.6GB+) by streaming to a temporary file on disk
+        rather than holding the response in memory. The caller is responsible
+        for deleting the file at image.filename once the image is closed.
     """
     print(f"Downloading {url}...")
     response = requests.get(url, stream=True)
@@ -70,20 +281,30 @@ def download_image(url):
     if total_size > 0:
         print(f"File size: {total_size / (1024**3):.2f} GB")
     
-    content = BytesIO()
+    suffix = Path(url.split('?', 1)[0]).suffix or '.png'
+    tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
     downloaded = 0
     
-    for chunk in response.iter_content(chunk_size=8192):
-        if chunk:
-            content.write(chunk)
-            downloaded += len(chunk)
-            if total_size > 0:
-                percent = (downloaded / total_size) * 100
-                print(f"\rProgress: {percent:.1f}%", end='', flush=True)
+    last_print = 0.0
     
-    print("\nDownload complete! Loading image...")
-    content.seek(0)
-    return Image.open(content)
+    try:
+        with tmp:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                if chunk:
+                    tmp.write(chunk)
+                    downloaded += len(chunk)
+                    # Throttle progress output to a few updates per second
+                    now = time.monotonic()
+                    if total_size > 0 and (now - last_print >= PROGRESS_INTERVAL or downloaded == total_size):
+                        last_print = now
+                        percent = (downloaded / total_size) * 100
+                        print(f"\rProgress: {percent:.1f}%", end='', flush=True)
+        
+        print("\nDownload complete! Loading image...")
+        return Image.open(tmp.name)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
 def auto_crop_padding(image, map_size):
     """Automatically detect and crop padding from square-padded images.
@@ -100,12 +321,97 @@ def auto_crop_padding(image, map_size):
         from actual map content to padding areas. Falls back to config size
         if auto-detection fails.
     """
+    crop_box = _content_crop_box(image, map_size)
+    if crop_box is None:
+        return image
+    
+    print(f"Cropping to box: {crop_box}")
+    return image.crop(crop_box)
+
+def _content_crop_box(image, map_size):
+    """Choose the crop box auto_crop_padding() applies to an image.
+    
+    Args:
+        image: PIL.Image object (potentially padded to square)
+        map_size: [width, height] from map config (actual game dimensions)
+        
+    Returns:
+        tuple: (left, top, right, bottom) crop box, or None if no crop is needed
+    """
+    crop_box = _padding_crop_box(image.size, map_size)
+    if crop_box is None:
+        return None
+    
+    detected_box = _detect_padding_box(image, map_size)
+    if detected_box is not None:
+        print("Detected padding edges from pixel data")
+        crop_box = detected_box
+    return crop_box
+
+def _detect_padding_box(image, map_size):
+    """Find the bounding box of map content by scanning for the padding colour.
+    
+    Args:
+        image: PIL.Image object padded with a solid colour
+        map_size: [width, height] from map config (actual game dimensions)
+        
+    Returns:
+        tuple: (left, top, right, bottom) content box, or None if no solid
+        padding is found or the content does not match the expected aspect ratio
+        
+    Note:
+        The padding colour is taken from the bottom-right corner pixel. Rows are
+        scanned in bands, each reduced with NumPy to per-row and per-column
+        "has content" flags, so the full image is never compared at once.
+    """
     width, height = image.size
+    pad_color = np.asarray(image.crop((width - 1, height - 1, width, height)).convert('RGB'))[0, 0]
+    
+    row_has_content = np.zeros(height, dtype=bool)
+    col_has_content = np.zeros(width, dtype=bool)
+    for y in range(0, height, SHARED_COPY_ROWS):
+        y2 = min(y + SHARED_COPY_ROWS, height)
+        band = np.asarray(image.crop((0, y, width, y2)).convert('RGB'))
+        content = (band != pad_color).any(axis=2)
+        row_has_content[y:y2] = content.any(axis=1)
+        col_has_content |= content.any(axis=0)
+    
+    if not row_has_content.any():
+        return None
+    
+    left = int(np.argmax(col_has_content))
+    right = width - int(np.argmax(col_has_content[::-1]))
+    top = int(np.argmax(row_has_content))
+    bottom = height - int(np.argmax(row_has_content[::-1]))
+    if (left, top, right, bottom) == (0, 0, width, height):
+        return None
+    
+    # Reject boxes that do not look like the configured map (e.g. content edges
+    # that happen to match the padding colour)
+    expected_width, expected_height = map_size
+    detected_ratio = (right - left) / (bottom - top)
+    expected_ratio = expected_width / expected_height
+    if abs(detected_ratio - expected_ratio) > 0.05 * expected_ratio:
+        return None
+    
+    return (left, top, right, bottom)
+
+def _padding_crop_box(image_size, map_size):
+    """Compute the crop box that removes square padding from a map image.
+    
+    Args:
+        image_size: (width, height) of the source image
+        map_size: [width, height] from map config (actual game dimensions)
+        
+    Returns:
+        tuple: (left, top, right, bottom) crop box, or None if no crop is needed
+    """
+    width, height = image_size
     expected_width, expected_height = map_size
     
     # If already close to expected dimensions, no cropping needed
     if abs(width - expected_width) < 100 and abs(height - expected_height) < 100:
-        return image
+        return None
     
     # If image is square but map should be rectangular, crop it
     if width == height and expected_width != expected_height:
@@ -121,12 +427,156 @@ def auto_crop_padding(image, map_size):
             crop_width = int(height * expected_width / expected_height)
             crop_box = (0, 0, crop_width, height)
         
-        print(f"Cropping to box: {crop_box}")
-        return image.crop(crop_box)
+        return crop_box
+    
+    return None
+
+def _padded_cache_key(image, crop_box):
+    """Describe the source a padded base image is built from.
+    
+    Args:
+        image: PIL.Image of the source map, before cropping
+        crop_box: (left, top, right, bottom) crop applied to it, or None
+        
+    Returns:
+        dict: Source path, mtime, size and crop box, or None if the image
+        was not opened from a file (such images are never cached)
+    """
+    filename = getattr(image, 'filename', None)
+    if not filename:
+        return None
+    stat = os.stat(filename)
+    return {
+        'source': str(Path(filename).resolve()),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'crop_box': list(crop_box) if crop_box is not None else None,
+    }
+
+def _load_padded_cache(cache_path, shape, key):
+    """Memory-map a padded base image saved by a previous run.
     
-    return image
+    Args:
+        cache_path: Path of the .npy cache file
+        shape: Expected (height, width, 3) shape of the padded image
+        key: Source description from _padded_cache_key() the cache must match
+        
+    Returns:
+        np.ndarray: Read-only memory-mapped pixel array, or None if the cache
+        is missing, unreadable, was built from a different source or does not
+        match the expected shape
+    """
+    if key is None or not cache_path.exists():
+        return None
+    try:
+        if json.loads(cache_path.with_suffix('.json').read_text()) != key:
+            return None
+    except (OSError, ValueError):
+        return None
+    try:
+        padded = np.load(cache_path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    if padded.shape != shape or padded.dtype != np.uint8:
+        return None
+    return padded
 
-def generate_tiles(image, map_name, max_zoom, output_dir, map_size=None):
+def _save_padded_cache(image, cache_path, shape, key):
+    """Pad an image with black to the given shape directly into a .npy cache file.
+    
+    Args:
+        image: PIL.Image of the (cropped) source map
+        cache_path: Path of the .npy cache file to create
+        shape: (height, width, 3) shape of the padded image
+        key: Source description from _padded_cache_key(), saved next to the
+            cache as a .json sidecar (None to skip it)
+        
+    Returns:
+        np.ndarray: Read-only memory-mapped pixel array of the padded image
+        
+    Note:
+        Rows are copied in bands into a memory-mapped file, so the padded
+        image is never held in memory. The file is written under a temporary
+        name and renamed once complete so an interrupted run leaves no cache.
+        The sidecar is written last, so a cache without one is never reused.
+    """
+    width, height = image.size
+    key_path = cache_path.with_suffix('.json')
+    key_path.unlink(missing_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    padded = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.uint8, shape=shape)
+    try:
+        for y in range(0, height, SHARED_COPY_ROWS):
+            y2 = min(y + SHARED_COPY_ROWS, height)
+            padded[y:y2, :width] = np.asarray(image.crop((0, y, width, y2)).convert('RGB'))
+        padded.flush()
+    except BaseException:
+        del padded
+        tmp_path.unlink(missing_ok=True)
+        raise
+    del padded
+    os.replace(tmp_path, cache_path)
+    if key is not None:
+        key_path.write_text(json.dumps(key))
+    return np.load(cache_path, mmap_mode='r')
+
+def _image_to_gpu(image):
+    """Upload an RGB image to the GPU in bounded row bands.
+    
+    Args:
+        image: PIL.Image in RGB mode, or (height, width, 3) uint8 array
+        
+    Returns:
+        torch.Tensor: (1, 3, height, width) uint8 tensor on the CUDA device
+    """
+    width, height = _image_size(image)
+    level = torch.empty((1, 3, height, width), dtype=torch.uint8, device='cuda')
+    for y in range(0, height, SHARED_COPY_ROWS):
+        y2 = min(y + SHARED_COPY_ROWS, height)
+        band = torch.tensor(_image_rows(image, y, y2))
+        level[0, :, y:y2] = band.to('cuda').permute(2, 0, 1)
+    return level
+
+def _resize_on_gpu(level, width, height):
+    """Downscale a GPU-resident level with antialiased bicubic resampling.
+    
+    Args:
+        level: (1, 3, H, W) uint8 tensor on the CUDA device
+        width: Target width in pixels
+        height: Target height in pixels
+        
+    Returns:
+        tuple: (resized uint8 tensor kept on the GPU, PIL.Image copy for tiling)
+        
+    Note:
+        The level is converted to float32 in overlapping bands of GPU_BAND_ROWS
+        output rows rather than all at once, so the working copy stays small.
+        Bands start on whole multiples of the scale factor and the overlap is
+        cropped away, so the result matches resizing the level in one call.
+        Raises torch.cuda.OutOfMemoryError if even a band does not fit.
+    """
+    src_height = level.shape[2]
+    scale = src_height // height
+    resized = torch.empty((1, 3, height, width), dtype=torch.uint8, device=level.device)
+    pixels = np.empty((height, width, 3), dtype=np.uint8)
+    for y in range(0, height, GPU_BAND_ROWS):
+        y2 = min(y + GPU_BAND_ROWS, height)
+        band_y = max(0, y - GPU_BAND_OVERLAP)
+        band_y2 = min(height, y2 + GPU_BAND_OVERLAP)
+        band = level[:, :, band_y * scale:band_y2 * scale].float()
+        band = F.interpolate(band, size=(band_y2 - band_y, width), mode='bicubic', antialias=True)
+        resized[:, :, y:y2] = band[:, :, y - band_y:y2 - band_y].round_().clamp_(0, 255)
+        del band
+        pixels[y:y2] = resized[0, :, y:y2].permute(1, 2, 0).cpu().numpy()
+    return resized, Image.fromarray(pixels)
+
+def _release_gpu():
+    """Free cached GPU memory after a CUDA out-of-memory error and report the Pillow fallback."""
+    torch.cuda.empty_cache()
+    print("  GPU out of memory, downscaling the remaining levels with Pillow")
+
+def generate_tiles(image, map_name, max_zoom, output_dir, map_size=None, skip_existing=False,
+                   use_gpu=False, cache_padded=True):
     """Generate tile pyramid for all zoom levels.
     
     Args:
@@ -135,14 +585,28 @@ def generate_tiles(image, map_name, max_zoom, output_dir, map_size=None):
         max_zoom: Maximum zoom level (highest detail)
         output_dir: Base directory for tile output (creates tiles/{map_name}_sat/...)
         map_size: [width, height] from config for auto-cropping (optional)
+        skip_existing: Keep non-empty tiles already on disk instead of re-encoding
+            them, so an interrupted run can resume (optional)
+        use_gpu: Downscale zoom levels on a CUDA GPU with PyTorch instead of
+            Pillow's Lanczos, falling back to Pillow if the GPU runs out of
+            memory (optional, requires torch)
+        cache_padded: Keep the padded base on disk for later runs; pass False
+            for temporary source files that will not be seen again (optional)
         
     Process:
         1. Auto-crops padding if image is square-padded
-        2. Pads image to next power-of-2 dimensions
-        3. For each zoom level (0 to max_zoom):
-           - Scales image appropriately
+        2. Pads image to next power-of-2 dimensions. With cache_padded, the
+           padded base is written to {map_name}_padded.npy in output_dir and
+           reused by later runs of the same source file and crop (recorded in
+           {map_name}_padded.json); the top level is then tiled straight from
+           the memory map
+        3. For each zoom level (max_zoom down to 0):
+           - Halves the previous level with Lanczos resampling (or antialiased
+             bicubic on the GPU, where the level stays resident between halvings)
            - Divides into 256x256 tiles
-           - Saves tiles as WebP with quality=90
+           - Encodes tiles in parallel (one process per CPU core) as WebP with quality=90,
+             or lossless WebP for tiles with fewer than 32 colors
+           - Writes encoded tiles to disk from a separate writer thread pool
         4. Creates directory structure: {z}/{x}/{y}.webp
         
     Note:
@@ -151,8 +615,11 @@ def generate_tiles(image, map_name, max_zoom, output_dir, map_size=None):
         Output directory will have _sat suffix to match engine config
     """
     # Auto-crop padding if map_size provided
-    if map_size:
-        image = auto_crop_padding(image, map_size)
+    crop_box = _content_crop_box(image, map_size) if map_size else None
+    cache_key = _padded_cache_key(image, crop_box) if cache_padded else None
+    if crop_box is not None:
+        print(f"Cropping to box: {crop_box}")
+        image = image.crop(crop_box)
     
     width, height = image.size
     print(f"Image size after crop: {width}x{height}")
@@ -162,9 +629,21 @@ def generate_tiles(image, map_name, max_zoom, output_dir, map_size=None):
     next_height = 1 << (height - 1).bit_length() if height > 0 else 1
     
     if width != next_width or height != next_height:
-        print(f"Padding image from {width}x{height} to {next_width}x{next_height} for proper tiling...")
-        padded = Image.new('RGB', (next_width, next_height), (0, 0, 0))
-        padded.paste(image, (0, 0))
+        # Reuse the padded base from a previous run of the same source image
+        padded_cache = output_dir / f"{map_name}_padded.npy"
+        padded = _load_padded_cache(padded_cache, (next_height, next_width, 3), cache_key)
+        if padded is not None:
+            print(f"Using cached padded image {padded_cache}")
+        else:
+            print(f"Padding image from {width}x{height} to {next_width}x{next_height} for proper tiling...")
+            if cache_key is None:
+                # Nothing stable to key a cache on (temporary download or in-memory image)
+                padded = Image.new('RGB', (next_width, next_height), (0, 0, 0))
+                padded.paste(image, (0, 0))
+            else:
+                padded = _save_padded_cache(image, padded_cache, (next_height, next_width, 3), cache_key)
+        # A cached base is tiled straight from the memory map; a PIL copy is
+        # only made once the top level is done, to downscale it
         image = padded
         width, height = next_width, next_height
     
@@ -175,77 +654,237 @@ def generate_tiles(image, map_name, max_zoom, output_dir, map_size=None):
     map_dir.mkdir(parents=True, exist_ok=True)
     
     # Generate tiles for each zoom level
-    for zoom in range(max_zoom + 1):
+    # Work from the most detailed level down: each level is a 2x downscale of the
+    # previous one, so the full-resolution image is only read once
+    prev_img = None
+    prev_level_gpu = None
+    for zoom in range(max_zoom, -1, -1):
         print(f"Generating zoom level {zoom}...")
         zoom_dir = map_dir / str(zoom)
         zoom_dir.mkdir(exist_ok=True)
         
         # Calculate scale for this zoom level
-        scaled_width = width // (2 ** (max_zoom - zoom))
-        scaled_height = height // (2 ** (max_zoom - zoom))
+        scaled_width = width >> (max_zoom - zoom)
+        scaled_height = height >> (max_zoom - zoom)
         
-        # Resize image for this zoom level
-        if zoom < max_zoom:
-            scaled_img = image.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
-        else:
+        # Resize the previous level for this zoom level
+        scaled_img = None
+        if prev_img is None:
             scaled_img = image
+        elif use_gpu:
+            try:
+                prev_level_gpu, scaled_img = _resize_on_gpu(prev_level_gpu, scaled_width, scaled_height)
+            except torch.cuda.OutOfMemoryError:
+                use_gpu, prev_level_gpu = False, None
+                _release_gpu()
+        if scaled_img is None:
+            if isinstance(prev_img, np.ndarray):
+                prev_img = Image.fromarray(prev_img)
+            scaled_img = prev_img.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
+        
+        if not isinstance(scaled_img, np.ndarray) and scaled_img.mode != 'RGB':
+            scaled_img = scaled_img.convert('RGB')
+        
+        # Keep the full-resolution level on the GPU; only halved levels come back
+        if use_gpu and prev_level_gpu is None:
+            try:
+                prev_level_gpu = _image_to_gpu(scaled_img)
+            except torch.cuda.OutOfMemoryError:
+                use_gpu = False
+                _release_gpu()
         
         # Calculate number of tiles
-        cols = math.ceil(scaled_width / TILE_SIZE)
-        rows = math.ceil(scaled_height / TILE_SIZE)
+        cols = -(-scaled_width // TILE_SIZE)
+        rows = -(-scaled_height // TILE_SIZE)
         
         print(f"  Creating {cols}x{rows} = {cols*rows} tiles...")
         
-        # Generate tiles
-        tile_count = 0
-        total_tiles = cols * rows
-        
-        for col in range(cols):
-            col_dir = zoom_dir / str(col)
-            col_dir.mkdir(exist_ok=True)
+        shm = _copy_to_shared_memory(scaled_img)
+        try:
+            # Find empty tiles for the whole level in one vectorized pass
+            level = np.ndarray((scaled_height, scaled_width, 3), dtype=np.uint8, buffer=shm.buf)
+            has_content = _tile_content_mask(level, cols, rows)
+            del level
             
-            for row in range(rows):
-                # Calculate tile bounds
-                x1 = col * TILE_SIZE
-                y1 = row * TILE_SIZE
-                x2 = min(x1 + TILE_SIZE, scaled_width)
-                y2 = min(y1 + TILE_SIZE, scaled_height)
-                
-                # Extract tile
-                tile = scaled_img.crop((x1, y1, x2, y2))
-                
-                # Warn about completely black/empty tiles (padding areas)
-                extrema = tile.getextrema()
-                # getextrema() returns a tuple of (min, max) for grayscale or list of tuples for RGB
-                is_black = False
-                if isinstance(extrema[0], tuple):
-                    # RGB mode: extrema is a list/tuple of (min, max) tuples
-                    is_black = all(min_val == 0 and max_val == 0 for min_val, max_val in extrema)  # type: ignore
-                else:
-                    # Grayscale mode: extrema is a single (min, max) tuple
-                    is_black = extrema[0] == 0 and extrema[1] == 0
-                if is_black:
-                    print(f"  ⊗ Black/empty tile at zoom {zoom}, x={col}, y={row}")
-                
-                # If tile is smaller than TILE_SIZE, pad it
-                if tile.size != (TILE_SIZE, TILE_SIZE):
-                    padded = Image.new('RGB', (TILE_SIZE, TILE_SIZE), (0, 0, 0))
-                    padded.paste(tile, (0, 0))
-                    tile = padded
-                
-                # Save tile as WebP
-                tile_path = col_dir / f"{row}.webp"
-                tile.save(tile_path, 'WEBP', quality=WEBP_QUALITY, method=6)
+            # Create every column directory before encoding starts; workers only crop and encode
+            col_dirs = [zoom_dir / str(col) for col in range(cols)]
+            for col_dir in col_dirs:
+                col_dir.mkdir(exist_ok=True)
+            
+            # Tile bounds for the whole level, computed once per axis
+            x1s = np.arange(cols) * TILE_SIZE
+            y1s = np.arange(rows) * TILE_SIZE
+            x2s = np.minimum(x1s + TILE_SIZE, scaled_width)
+            y2s = np.minimum(y1s + TILE_SIZE, scaled_height)
+            
+            # Leave tiles from a previous run alone when resuming
+            pending = np.ones((rows, cols), dtype=bool)
+            if skip_existing:
+                for col, col_dir in enumerate(col_dirs):
+                    existing_rows = [row for row in _existing_tile_rows(col_dir) if row < rows]
+                    pending[existing_rows, col] = False
+                skipped = cols * rows - int(np.count_nonzero(pending))
+                if skipped:
+                    print(f"  Skipping {skipped} existing tiles")
+            
+            # Completely black/empty tiles (padding areas) all encode to the same bytes
+            black_tile_paths = []
+            for col, row in zip(*np.nonzero((~has_content & pending).T)):
+                print(f"  ⊗ Black/empty tile at zoom {zoom}, x={col}, y={row}")
+                black_tile_paths.append(col_dirs[col] / f"{row}.webp")
+            
+            content_cols, content_rows = np.nonzero((has_content & pending).T)
+            jobs = np.column_stack((x1s[content_cols], y1s[content_rows],
+                                    x2s[content_cols], y2s[content_rows])).tolist()
+            tile_paths = [col_dirs[col] / f"{row}.webp" for col, row in zip(content_cols, content_rows)]
+            
+            # Encode tiles in parallel from the shared copy of the scaled image,
+            # handing the bytes to a small thread pool so disk writes overlap encoding
+            tile_count = 0
+            total_tiles = len(jobs) + len(black_tile_paths)
+            pending_writes = deque()
+            with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                     initializer=_init_tile_worker,
+                                     initargs=(shm.name, (scaled_height, scaled_width, 3))) as executor, \
+                 ThreadPoolExecutor(max_workers=WRITER_THREADS) as writer:
+                black_tiles = ((tile_path, BLACK_TILE_WEBP) for tile_path in black_tile_paths)
+                encoded_tiles = zip(tile_paths, executor.map(_encode_tile, jobs, chunksize=64))
+                for tile_path, data in chain(black_tiles, encoded_tiles):
+                    pending_writes.append(writer.submit(_write_tile, tile_path, data))
+                    if len(pending_writes) >= MAX_PENDING_WRITES:
+                        pending_writes.popleft().result()
+                    
+                    tile_count += 1
+                    if tile_count % 100 == 0:
+                        print(f"\r  Progress: {tile_count}/{total_tiles} tiles", end='', flush=True)
                 
-                tile_count += 1
-                if tile_count % 100 == 0:
-                    print(f"\r  Progress: {tile_count}/{total_tiles} tiles", end='', flush=True)
+                # Surface any write errors before the level is reported complete
+                for future in pending_writes:
+                    future.result()
+        finally:
+            shm.close()
+            shm.unlink()
         
         print(f"\r  Completed: {tile_count}/{total_tiles} tiles")
         
-        # Clean up scaled image
-        if zoom < max_zoom:
-            scaled_img.close()
+        # Clean up the previous level; this one is the source for the next downscale
+        if prev_img is not None and prev_img is not image:
+            prev_img.close()
+        prev_img = scaled_img
+    
+    if prev_img is not None and prev_img is not image:
+        prev_img.close()
+
+def generate_tiles_vips(source_path, map_name, max_zoom, output_dir, map_size=None):
+    """Generate the tile pyramid with libvips in a single streaming pass.
+    
+    Produces the same {z}/{x}/{y}.webp layout as generate_tiles(), but lets
+    pyvips dzsave build every level from one sequential read of the source
+    file, so no full zoom level is ever held in memory.
+    
+    Args:
+        source_path: Path to the source map image file
+        map_name: Namespace of the map (e.g., 'everon', 'arland')
+        max_zoom: Maximum zoom level (highest detail)
+        output_dir: Base directory for tile output (creates tiles/{map_name}_sat/...)
+        map_size: [width, height] from config for auto-cropping (optional)
+        
+    Note:
+        dzsave downsamples with a 2x2 box filter rather than Lanczos, and
+        writes Google-layout {z}/{y}/{x} tiles whose level 0 is the first level
+        that fits in one tile. Tiles are moved into place from a staging
+        directory, and any zoom levels below that are halved from the
+        level above with Pillow.
+    """
+    image = pyvips.Image.new_from_file(str(source_path), access='sequential')
+    
+    # Drop alpha / expand greyscale so every tile is plain RGB
+    if image.bands > 3:
+        image = image.extract_band(0, n=3)
+    elif image.bands < 3:
+        image = image.colourspace('srgb')
+    
+    # Auto-crop padding if map_size provided
+    if map_size:
+        crop_box = _padding_crop_box((image.width, image.height), map_size)
+        if crop_box is not None:
+            print(f"Cropping to box: {crop_box}")
+            left, top, right, bottom = crop_box
+            image = image.crop(left, top, right - left, bottom - top)
+    
+    width, height = image.width, image.height
+    print(f"Image size after crop: {width}x{height}")
+    
+    # Pad each dimension independently to next power of 2
+    next_width = 1 << (width - 1).bit_length() if width > 0 else 1
+    next_height = 1 << (height - 1).bit_length() if height > 0 else 1
+    
+    if width != next_width or height != next_height:
+        print(f"Padding image from {width}x{height} to {next_width}x{next_height} for proper tiling...")
+        image = image.embed(0, 0, next_width, next_height, extend='black')
+        width, height = next_width, next_height
+    
+    print(f"Tiling with size: {width}x{height}")
+    
+    map_dir = output_dir / f"{map_name}_sat"
+    map_dir.mkdir(parents=True, exist_ok=True)
+    staging_dir = output_dir / f".{map_name}_sat_vips"
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    staging_dir.mkdir()
+    
+    try:
+        print("Building pyramid with libvips...")
+        image.dzsave(str(staging_dir / 'pyramid'),
+                     suffix=f'.webp[Q={WEBP_QUALITY},effort={WEBP_METHOD}]',
+                     tile_size=TILE_SIZE, overlap=0, layout='google',
+                     background=0, skip_blanks=-1)
+        
+        pyramid_dir = staging_dir / 'pyramid'
+        vips_max_zoom = max(int(p.name) for p in pyramid_dir.iterdir() if p.is_dir())
+        
+        prev_tile = None
+        for zoom in range(max_zoom, -1, -1):
+            print(f"Generating zoom level {zoom}...")
+            zoom_dir = map_dir / str(zoom)
+            zoom_dir.mkdir(exist_ok=True)
+            
+            # Same level size and tile grid as generate_tiles()
+            scaled_width = width >> (max_zoom - zoom)
+            scaled_height = height >> (max_zoom - zoom)
+            cols = -(-scaled_width // TILE_SIZE)
+            rows = -(-scaled_height // TILE_SIZE)
+            print(f"  Creating {cols}x{rows} = {cols*rows} tiles...")
+            
+            vips_zoom = vips_max_zoom - (max_zoom - zoom)
+            if vips_zoom < 0:
+                # Level smaller than dzsave's single-tile level 0: halve the
+                # previous tile, its content already sits in the top-left corner
+                tile = Image.new('RGB', (TILE_SIZE, TILE_SIZE), (0, 0, 0))
+                tile.paste(prev_tile.resize((TILE_SIZE // 2, TILE_SIZE // 2), Image.Resampling.LANCZOS))
+                prev_tile.close()
+                prev_tile = tile
+                col_dir = zoom_dir / '0'
+                col_dir.mkdir(exist_ok=True)
+                tile.save(col_dir / '0.webp', 'WEBP', quality=WEBP_QUALITY, method=WEBP_METHOD)
+            else:
+                # Remap Google {z}/{y}/{x} to our {z}/{x}/{y}, dropping the
+                # blank tiles dzsave adds beyond the padded image
+                vips_zoom_dir = pyramid_dir / str(vips_zoom)
+                for col in range(cols):
+                    col_dir = zoom_dir / str(col)
+                    col_dir.mkdir(exist_ok=True)
+                    for row in range(rows):
+                        os.replace(vips_zoom_dir / str(row) / f"{col}.webp", col_dir / f"{row}.webp")
+                if vips_zoom == 0:
+                    prev_tile = Image.open(zoom_dir / '0' / '0.webp').convert('RGB')
+            
+            print(f"  Completed: {cols*rows}/{cols*rows} tiles")
+        
+        if prev_tile is not None:
+            prev_tile.close()
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
 
 def find_map_by_namespace(maps, namespace):
     """Find map configuration by namespace identifier.
@@ -281,8 +920,22 @@ def main():
     parser = argparse.ArgumentParser(description='Generate map tiles for Arma Reforger maps')
     parser.add_argument('namespace', nargs='?', help='Map namespace or index (or omit for interactive mode)')
     parser.add_argument('--image', '-i', help='Path to local image file (overrides default location)')
+    parser.add_argument('--backend', choices=['pillow', 'vips'], default='pillow',
+                        help='Tiling backend: pillow (default) or vips (streaming, needs pyvips)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-encode every tile when resuming, even if it already exists')
+    parser.add_argument('--gpu', action='store_true',
+                        help='Downscale zoom levels on a CUDA GPU (needs torch; pillow backend only)')
     args = parser.parse_args()
     
+    if args.backend == 'vips' and pyvips is None:
+        print("Error: --backend vips requires pyvips (pip install pyvips)")
+        return
+    
+    if args.gpu and (torch is None or not torch.cuda.is_available()):
+        print("Error: --gpu requires PyTorch with a CUDA device (pip install torch)")
+        return
+    
     # Load maps data
     json_file = Path(__file__).parent / "all_arma_maps.json"
     with open(json_file, 'r') as f:
@@ -351,17 +1004,24 @@ def main():
             if tile_count > 0:
                 print(f"   Contains: {tile_count} tile files")
             
-            response = input("Delete existing tiles and regenerate? (y/N): ").strip().lower()
-            if response != 'y':
+            response = input("Delete existing tiles and regenerate, or resume missing tiles? (y/r/N): ").strip().lower()
+            if response == 'r':
+                print("Resuming into existing tiles directory...")
+            elif response != 'y':
                 print(f"Skipping {map_data['name']}")
                 continue
-            
-            # Delete existing tiles directory
-            print(f"Deleting existing tiles directory...")
-            shutil.rmtree(tile_dir)
-            print(f"✓ Deleted {tile_dir}")
+            else:
+                # Delete existing tiles directory
+                print(f"Deleting existing tiles directory...")
+                shutil.rmtree(tile_dir)
+                print(f"✓ Deleted {tile_dir}")
+                
+                # The cached padded base goes with the tiles it was built for
+                (output_dir / f"{map_data['namespace']}_padded.npy").unlink(missing_ok=True)
+                (output_dir / f"{map_data['namespace']}_padded.json").unlink(missing_ok=True)
         
         # Check for custom image path or use default location
+        downloaded_path = None
         if args.image:
             custom_image_path = Path(args.image)
             if not custom_image_path.exists():
@@ -380,6 +1040,7 @@ def main():
                     print(f"Local image not found, downloading from CDN...")
                     try:
                         image = download_image(cdn_url)
+                        downloaded_path = Path(image.filename)
                     except Exception as e:
                         print(f"\n✗ Error downloading from {cdn_url}: {e}")
                         print(f"Please ensure the satellite image exists locally at {local_image_path}")
@@ -401,21 +1062,37 @@ def main():
                 print(f"⚠️  Using landscape override for Seitenbuch tiles: {crop_size}")
             
             # Generate tiles
-            generate_tiles(
-                image,
-                map_data['namespace'],
-                map_data['max_zoom'],
-                output_dir,
-                crop_size  # Pass size for auto-cropping
-            )
+            if args.backend == 'vips':
+                generate_tiles_vips(
+                    image.filename,
+                    map_data['namespace'],
+                    map_data['max_zoom'],
+                    output_dir,
+                    crop_size  # Pass size for auto-cropping
+                )
+            else:
+                generate_tiles(
+                    image,
+                    map_data['namespace'],
+                    map_data['max_zoom'],
+                    output_dir,
+                    crop_size,  # Pass size for auto-cropping
+                    skip_existing=not args.force,
+                    use_gpu=args.gpu,
+                    cache_padded=downloaded_path is None  # The download is deleted after this run
+                )
             
-            image.close()
             print(f"\n✓ {map_data['name']} complete!\n")
             
         except Exception as e:
             print(f"\n✗ Error processing {map_data['name']}: {e}\n")
             import traceback
             traceback.print_exc()
+        finally:
+            image.close()
+            # Remove the temporary copy of a downloaded source image
+            if downloaded_path is not None:
+                downloaded_path.unlink(missing_ok=True)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,42 @@
+"""Check that the pillow and vips backends write the same tile tree.
+
+Run with: python -m pytest maps_core/tests
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import generate_tiles
+
+pytest.importorskip("pyvips")
+
+
+def _tile_layout(map_dir):
+    """Relative {z}/{x}/{y}.webp paths under a map tile directory."""
+    return sorted(str(path.relative_to(map_dir)) for path in map_dir.rglob('*.webp'))
+
+
+@pytest.mark.parametrize("size, max_zoom", [
+    ((1100, 700), 3),   # padded to 2048x1024, edge tiles in both directions
+    ((600, 300), 4),    # levels below dzsave's single-tile level
+    ((256, 256), 0),    # already a single power-of-2 tile
+])
+def test_vips_and_pillow_layouts_match(tmp_path, size, max_zoom):
+    width, height = size
+    rng = np.random.default_rng(0)
+    source = tmp_path / "source.png"
+    Image.fromarray((rng.random((height, width, 3)) * 255).astype(np.uint8)).save(source)
+
+    with Image.open(source) as image:
+        generate_tiles.generate_tiles(image, 'pillow', max_zoom, tmp_path)
+    generate_tiles.generate_tiles_vips(source, 'vips', max_zoom, tmp_path)
+
+    pillow_tiles = _tile_layout(tmp_path / 'pillow_sat')
+    assert pillow_tiles
+    assert _tile_layout(tmp_path / 'vips_sat') == pillow_tiles
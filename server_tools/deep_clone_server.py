@@ -24,19 +24,104 @@ Usage:
     python deep_clone_server.py --battlemetrics 32653210 diff.json --compare existing_config.json
 """
 
+import csv
 import json
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import Dict, List
 
-import urllib3
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None  # Large server.txt files are parsed with the csv module instead
 
 # Import BattleMetrics integration from mod_manager
 from mod_manager import BattleMetricsAPI, HTTPClient, ModInfo
 
-# Disable SSL verification warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# Shared client so repeated BattleMetrics calls reuse the same pooled connections
+_HTTP_CLIENT = HTTPClient()
+
+def _dumps_json(obj) -> bytes:
+    """Serialize obj to 2-space indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _write_json(path: str, obj) -> None:
+    """Write obj as indented JSON to path."""
+    Path(path).write_bytes(_dumps_json(obj))
+
+def _write_json_stream(path: str, entries) -> None:
+    """Write an iterable of JSON-serializable entries as an indented JSON array.
+
+    Entries are serialized and written one at a time, so the full list never has to
+    exist in memory; the output is byte-identical to _write_json(path, list(entries)).
+    """
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as outfile:
+        first = True
+        for entry in entries:
+            outfile.write("[\n  " if first else ",\n  ")
+            outfile.write(_dumps_json(entry).decode('utf-8').replace("\n", "\n  "))
+            first = False
+        outfile.write("[]" if first else "\n]")
+
+def _read_json(path: str):
+    """Load and return the JSON document stored at path."""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# server.txt files larger than this are streamed line by line instead of read in one go
+_STREAM_THRESHOLD = 16 << 20
+# server.txt files larger than this are parsed with pandas when it is installed
+_PANDAS_THRESHOLD = 1 << 20
+
+def _iter_server_txt_rows(input_file: str):
+    """Return an iterator of (name, version, mod_id) tuples from a tab-separated server.txt file.
+
+    Small files are read with a single call and tokenized from memory; files larger
+    than _STREAM_THRESHOLD are streamed so memory use stays bounded.
+    """
+    if os.path.getsize(input_file) > _STREAM_THRESHOLD:
+        return _stream_server_txt_rows(input_file)
+    text = Path(input_file).read_text(encoding='utf-8')
+    return _parse_server_txt_rows(text.splitlines())
+
+def _stream_server_txt_rows(input_file: str):
+    """Yield server.txt rows while reading the file incrementally."""
+    with open(input_file, 'r', newline='', encoding='utf-8') as file:
+        yield from _parse_server_txt_rows(file)
+
+def _parse_server_txt_rows(lines):
+    """Tokenize server.txt lines, skipping rows without exactly name, version and mod_id."""
+    for row in csv.reader(lines, delimiter='\t', quoting=csv.QUOTE_NONE):
+        if len(row) == 3:
+            name, version, mod_id = row
+            name, mod_id = name.strip(), mod_id.strip()
+            if name and mod_id:
+                yield name, version, mod_id
+
+def _read_server_txt_records_pandas(input_file: str, remove_version: bool) -> List[Dict[str, str]]:
+    """Parse a server.txt file into mod entry dicts with pandas' C tokenizer.
+
+    Applies the same row rules as _parse_server_txt_rows: rows must have exactly
+    three fields and a non-empty name and mod ID.
+    """
+    df = pd.read_csv(input_file, sep='\t', header=None, names=['name', 'version', 'modId'],
+                     dtype=str, quoting=csv.QUOTE_NONE, keep_default_na=False,
+                     on_bad_lines='skip', encoding='utf-8')
+    df['name'] = df['name'].str.strip()
+    df['modId'] = df['modId'].str.strip()
+    df = df[(df['name'] != '') & (df['modId'] != '')]
+    if remove_version:
+        df = df.assign(version='')
+    return df[['modId', 'name', 'version']].to_dict(orient='records')
 
 def transform_server_txt_to_json(input_file: str, output_file: str, remove_version: bool) -> None:
     """Transforms a server.txt file into an Arma Reforger JSON configuration file.
@@ -58,22 +143,23 @@ def transform_server_txt_to_json(input_file: str, output_file: str, remove_versi
         >>> transform_server_txt_to_json("mods.txt", "config.json", False)
         # Creates config.json with mod entries including version info
     """
-    mods = []
-    with open(input_file, 'r', encoding='utf-8') as file:
-        for line in file:
-            parts = line.strip().split('\t')
-            if len(parts) == 3:  # Ensure we have name, version, and mod_id
-                name, version, mod_id = parts
-                mod_entry = {
-                    "modId": mod_id,
-                    "name": name,
-                    "version": "" if remove_version else version
-                }
-                mods.append(mod_entry)
-    
-    # Write the mod list as JSON with proper formatting
-    with open(output_file, 'w', encoding='utf-8') as file:
-        json.dump(mods, file, indent=4, ensure_ascii=False)
+    input_size = os.path.getsize(input_file)
+    if pd is not None and input_size > _PANDAS_THRESHOLD:
+        _write_json(output_file, _read_server_txt_records_pandas(input_file, remove_version))
+        return
+
+    entries = (
+        {
+            "modId": mod_id,
+            "name": name,
+            "version": "" if remove_version else version
+        }
+        for name, version, mod_id in _iter_server_txt_rows(input_file)
+    )
+    if input_size > _STREAM_THRESHOLD:
+        _write_json_stream(output_file, entries)  # Serialize entry by entry to bound memory
+    else:
+        _write_json(output_file, list(entries))  # One dumps() call and one write
 
 def compare_mods(server_source: str, json_file: str, output_file: str, is_battlemetrics: bool = False, api_base_url: str = "https://api.battlemetrics.com") -> Dict[str, List[str]]:
     """Compares mod lists between a server source and an Arma Reforger JSON config.
@@ -114,38 +200,26 @@ def compare_mods(server_source: str, json_file: str, output_file: str, is_battle
     if is_battlemetrics:
         # Fetch mods from BattleMetrics server
         mods_data = fetch_mods_from_battlemetrics(server_source, api_base_url)
-        server_mods = {mod['modId'] for mod in mods_data}
+        server_ids = {mod['modId'] for mod in mods_data}
     else:
-        # Load mods from server.txt file
-        server_mods = set()
-        with open(server_source, 'r', encoding='utf-8') as file:
-            for line in file:
-                parts = line.strip().split('\t')
-                if len(parts) == 3:  # name, version, mod_id
-                    _, _, mod_id = parts
-                    server_mods.add(mod_id)
+        # Load mod IDs from server.txt file; only the IDs take part in the diff
+        server_ids = {mod_id for _, _, mod_id in _iter_server_txt_rows(server_source)}
 
     # Load mods from JSON configuration file
-    with open(json_file, 'r', encoding='utf-8') as file:
-        json_data = json.load(file)
-        # Handle both direct mod arrays and nested game.mods structure
-        if isinstance(json_data, list):
-            json_mods = {mod['modId'] for mod in json_data}
-        else:
-            json_mods = {mod['modId'] for mod in json_data.get('game', {}).get('mods', [])}
-
-    # Calculate differences between the two mod sets
-    added_mods = json_mods - server_mods  # In JSON but not in server source
-    removed_mods = server_mods - json_mods  # In server source but not in JSON
+    json_data = _read_json(json_file)
+    # Handle both direct mod arrays and nested game.mods structure
+    if not isinstance(json_data, list):
+        json_data = json_data.get('game', {}).get('mods', [])
+    json_ids = {mod['modId'] for mod in json_data}
 
+    # Calculate differences directly on the ID sets; sorted so diffs are reproducible
     diff = {
-        "added": list(added_mods),
-        "removed": list(removed_mods)
+        "added": sorted(json_ids.difference(server_ids)),  # In JSON but not in server source
+        "removed": sorted(server_ids.difference(json_ids))  # In server source but not in JSON
     }
 
     # Write the diff report as JSON
-    with open(output_file, 'w', encoding='utf-8') as file:
-        json.dump(diff, file, indent=4, ensure_ascii=False)
+    _write_json(output_file, diff)
 
     return diff
 
@@ -181,8 +255,7 @@ def fetch_mods_from_battlemetrics(server_id: str, api_base_url: str = "https://a
         Requires an active internet connection and valid BattleMetrics server ID.
         The server must be online and visible in BattleMetrics for data retrieval.
     """
-    http_client = HTTPClient()
-    api = BattleMetricsAPI(http_client, api_base_url)
+    api = BattleMetricsAPI(_HTTP_CLIENT, api_base_url)
     
     try:
         # Fetch mods using the BattleMetrics API
@@ -195,13 +268,7 @@ def fetch_mods_from_battlemetrics(server_id: str, api_base_url: str = "https://a
             return []
             
         # Convert ModInfo objects to dictionary format for JSON serialization
-        mods = []
-        for mod_info in mods_data:
-            mods.append({
-                "modId": mod_info.mod_id,
-                "name": mod_info.name,
-                "version": mod_info.version
-            })
+        mods = [{"modId": m.mod_id, "name": m.name, "version": m.version} for m in mods_data]
             
         print(f"Successfully fetched {len(mods)} mods from BattleMetrics")
         return mods
@@ -273,15 +340,11 @@ if __name__ == "__main__":
                 # Fetch mods from BattleMetrics and create JSON
                 mods = fetch_mods_from_battlemetrics(args.input_source, args.bmetrics_base_url)
                 
-                # Apply version removal if requested
+                # The mod list is already in memory, so write it in one go
                 if args.remove_version:
-                    for mod in mods:
-                        mod['version'] = ""
-                
-                # Write JSON output
-                with open(args.output_file, 'w') as file:
-                    json.dump(mods, file, indent=4)
-                    
+                    mods = [{**mod, "version": ""} for mod in mods]
+                _write_json(args.output_file, mods)
+
                 print(f"Server configuration cloned from BattleMetrics server {args.input_source} at: {args.output_file}")
             else:
                 # Use original file-based transformation
@@ -1,38 +1,156 @@
+import hashlib
 import requests
 import json
-from bs4 import BeautifulSoup
+import re
+from bs4 import BeautifulSoup, SoupStrainer
 import sys
-import urllib3
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Disable SSL verification warnings.
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
 
+try:
+    import httpx
+    import h2  # noqa: F401  (HTTP/2 support for httpx)
+except ImportError:
+    httpx = None  # Fall back to a pooled requests.Session over HTTP/1.1
 
-def extract_meta_content(html, meta_name):
-    """Extracts the content of a meta tag with a specific property from the HTML.
+
+def create_session(max_connections=20):
+    """Creates the shared HTTP client used for all workshop requests.
+
+    Uses an HTTP/2 httpx.Client when httpx[http2] is installed, so concurrent
+    requests are multiplexed over a single connection; otherwise a
+    requests.Session with a pooled, retrying adapter.
+
+    Args:
+        max_connections (int): Size of the connection pool.
+
+    Returns:
+        httpx.Client or requests.Session: The configured client.
+    """
+    if httpx is not None:
+        transport = httpx.HTTPTransport(
+            http2=True, retries=3,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections))
+        return httpx.Client(transport=transport, timeout=10.0, follow_redirects=True)
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections,
+                                          max_retries=Retry(total=3, backoff_factor=0.3)))
+    return session
+
+
+# Shared client so every workshop page reuses pooled keep-alive connections.
+_SESSION = create_session()
+_REQUEST_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
+
+# On-disk cache of parsed workshop pages:
+# mod_id -> {"name", "deps", "etag", "last_modified", "fetched_at"}.
+CACHE_FILE = Path.home() / ".cache" / "armareforger" / "mod_extract_cache.json"
+CACHE_TTL = 24 * 60 * 60  # Seconds before a cached page is revalidated with the server.
+
+# Prefer the C-backed lxml parser when it is installed.
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Only the <meta> tags and <section> blocks are ever inspected, so skip building the rest of the tree.
+_PAGE_STRAINER = SoupStrainer(["meta", "section"])
+_META_STRAINER = SoupStrainer("meta")
+
+# Fast path for dependency extraction: locate the dependency section and its links in the raw HTML.
+_DEP_SECTION_RE = re.compile(r'<section\b[^>]*\bclass="(?:[^"]*\s)?py-8(?:\s[^"]*)?"')
+_DEP_LINK_RE = re.compile(r'<a\b[^>]*\bclass="(?:[^"]*\s)?bg-black/75(?:\s[^"]*)?"[^>]*>')
+_HREF_RE = re.compile(r'\bhref="([^"]*)"')
+
+# Parsed pages keyed by a digest of their HTML, so identical bodies are only parsed once.
+_PAGE_CACHE_SIZE = 512
+_PAGE_CACHE = OrderedDict()
+_PAGE_CACHE_LOCK = threading.Lock()
+
+
+def load_cache(path=CACHE_FILE):
+    """Loads the workshop page cache.
+
+    Entries older than CACHE_TTL are kept so their ETag/Last-Modified
+    validators can be used for conditional requests.
+
+    Args:
+        path (Path): Path of the cache file.
+
+    Returns:
+        dict: The cache mapping mod IDs to cached entries (empty if unavailable).
+    """
+    try:
+        with open(path, "rb") as f:
+            cache = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache(cache, path=CACHE_FILE):
+    """Writes the workshop page cache to disk.
+
+    Args:
+        cache (dict): The cache mapping mod IDs to cached entries.
+        path (Path): Path of the cache file; its directory is created if missing.
+    """
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"Failed to save mod cache: {e}")
+
+
+def parse_html(html):
+    """Parses a workshop page into a (partial) BeautifulSoup tree.
 
     Args:
         html (str): The HTML content of the page.
+
+    Returns:
+        BeautifulSoup: The parsed tree, restricted to meta and section tags.
+    """
+    return BeautifulSoup(html, _HTML_PARSER, parse_only=_PAGE_STRAINER)
+
+
+def extract_meta_content(soup, meta_name):
+    """Extracts the content of a meta tag with a specific property from the page.
+
+    Args:
+        soup (BeautifulSoup): The parsed page, as returned by parse_html.
         meta_name (str): The name of the meta property to extract.
 
     Returns:
         str: The content of the meta tag, or None if not found.
     """
-    soup = BeautifulSoup(html, 'html.parser')
     meta_tag = soup.find("meta", {"property": f"og:{meta_name}"})
     return meta_tag["content"] if meta_tag else None
 
 
-def extract_dependencies(html):
-    """Extracts the list of dependencies (mod IDs) from the HTML of a mod's workshop page.
+def extract_dependencies(soup):
+    """Extracts the list of dependencies (mod IDs) from a mod's workshop page.
 
     Args:
-        html (str): The HTML content of the page.
+        soup (BeautifulSoup): The parsed page, as returned by parse_html.
 
     Returns:
         list: A list of mod IDs representing the dependencies.
     """
-    soup = BeautifulSoup(html, 'html.parser')
     dependencies_section = soup.find("section", {"class": "py-8"})
     if not dependencies_section:
         return []
@@ -40,39 +158,191 @@ def extract_dependencies(html):
     return [link["href"].split("/")[-1].split("-")[0] for link in dependency_links]
 
 
-def fetch_mod_details(mod_id, visited):
-    """Recursively fetches details of a mod and its dependencies.
+def extract_dependencies_fast(html):
+    """Extracts dependency mod IDs from raw HTML with regular expressions.
 
     Args:
-        mod_id (str): The ID of the mod to fetch.
-        visited (set): A set of already visited mod IDs to avoid duplication.
+        html (str): The HTML content of the page.
 
     Returns:
-        list: A list of dictionaries containing mod details.
+        list: The dependency mod IDs, or None if the dependency section exists
+            but no links could be matched (the caller should fall back to
+            extract_dependencies).
     """
-    if mod_id in visited:
+    section_match = _DEP_SECTION_RE.search(html)
+    if not section_match:
         return []
-    visited.add(mod_id)
+    end = html.find("</section>", section_match.end())
+    section = html[section_match.end():end if end != -1 else len(html)]
+
+    dependencies = []
+    for link_match in _DEP_LINK_RE.finditer(section):
+        href_match = _HREF_RE.search(link_match.group())
+        if href_match:
+            dependencies.append(href_match.group(1).split("/")[-1].split("-")[0])
+    return dependencies or None
+
+
+def _parse_page_uncached(html):
+    """Extracts the mod title and dependency IDs from a workshop page."""
+    dependencies = extract_dependencies_fast(html)
+    if dependencies is None:
+        soup = parse_html(html)
+        return extract_meta_content(soup, "title"), extract_dependencies(soup)
+
+    soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_META_STRAINER)
+    return extract_meta_content(soup, "title"), dependencies
+
+
+def parse_page(html):
+    """Extracts the mod title and dependency IDs from a workshop page in one parse.
+
+    Results are memoized in a small LRU cache keyed by a digest of the
+    HTML, so identical page bodies are never parsed twice.
+
+    Args:
+        html (str): The HTML content of the page.
+
+    Returns:
+        tuple: (title, dependency_ids) where title may be None.
+    """
+    key = hashlib.blake2b(html.encode("utf-8"), digest_size=16).digest()
+    with _PAGE_CACHE_LOCK:
+        cached = _PAGE_CACHE.get(key)
+        if cached is not None:
+            _PAGE_CACHE.move_to_end(key)
+    if cached is None:
+        title, dependencies = _parse_page_uncached(html)
+        cached = (title, tuple(dependencies))
+        with _PAGE_CACHE_LOCK:
+            _PAGE_CACHE[key] = cached
+            if len(_PAGE_CACHE) > _PAGE_CACHE_SIZE:
+                _PAGE_CACHE.popitem(last=False)
+    return cached[0], list(cached[1])
+
 
+def clear_page_cache():
+    """Clears the in-memory parse_page cache."""
+    with _PAGE_CACHE_LOCK:
+        _PAGE_CACHE.clear()
+
+
+def fetch_one(mod_id, session=_SESSION, cached_entry=None):
+    """Fetches a single mod page and extracts its details.
+
+    When a cached entry carries an ETag or Last-Modified validator, the
+    request is made conditional and a 304 response reuses the cached data
+    without downloading or parsing the page again.
+
+    Args:
+        mod_id (str): The ID of the mod to fetch.
+        session (httpx.Client or requests.Session): HTTP client used for the request.
+        cached_entry (dict): Previous cache entry for this mod, if any.
+
+    Returns:
+        dict: A cache entry with "name", "deps", "etag", "last_modified" and
+            "fetched_at" keys, or None if the fetch failed.
+    """
     url = f"https://reforger.armaplatform.com/workshop/{mod_id}"
-    response = requests.get(url, verify=False)
+    headers = {}
+    if cached_entry:
+        if cached_entry.get("etag"):
+            headers["If-None-Match"] = cached_entry["etag"]
+        if cached_entry.get("last_modified"):
+            headers["If-Modified-Since"] = cached_entry["last_modified"]
+
+    try:
+        response = session.get(url, headers=headers, timeout=10)
+    except _REQUEST_ERRORS as e:
+        print(f"Failed to fetch mod {mod_id}: {e}")
+        return None
+    if response.status_code == 304 and cached_entry:
+        return {**cached_entry, "fetched_at": time.time()}
     if response.status_code != 200:
         print(f"Failed to fetch mod {mod_id}")
-        return []
-
-    html = response.text
-    mod_name = extract_meta_content(html, "title")
-    dependencies = extract_dependencies(html)
+        return None
 
-    mod_data = {
-        "modId": mod_id,
+    mod_name, dependencies = parse_page(response.text)
+    return {
         "name": mod_name,
-        "version": ""  # Version information is currently not extracted.
+        "deps": dependencies,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "fetched_at": time.time(),
     }
 
-    all_mods = [mod_data]
-    for dependency_id in dependencies:
-        all_mods.extend(fetch_mod_details(dependency_id, visited))
+
+def fetch_mod_details(mod_id, visited, session=_SESSION, max_workers=20, cache=None):
+    """Fetches details of a mod and all of its dependencies.
+
+    Mods are processed from a worklist: each dependency is submitted as
+    soon as the page that references it has been parsed, keeping up to
+    max_workers requests in flight without waiting for a whole level of
+    the tree to finish.
+
+    Args:
+        mod_id (str): The ID of the mod to fetch.
+        visited (set): A set of already visited mod IDs to avoid duplication.
+        session (httpx.Client or requests.Session): HTTP client used for all requests.
+        max_workers (int): Maximum number of concurrent requests.
+        cache (dict): Optional page cache (see load_cache). Entries younger
+            than CACHE_TTL are used without any request, older ones are
+            revalidated with a conditional GET; the cache is updated in place.
+
+    Returns:
+        list: A list of dictionaries containing mod details, in breadth-first
+            order from the root mod.
+    """
+    cached = cache if cache is not None else {}
+    entries = {}  # mod_id -> cache entry
+    pending = {}  # future -> mod_id
+    queue = deque([mod_id])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while queue or pending:
+            while queue:
+                m = queue.popleft()
+                if m in visited:
+                    continue
+                visited.add(m)
+                entry = cached.get(m)
+                if entry and time.time() - entry.get("fetched_at", 0) < CACHE_TTL:
+                    entries[m] = entry
+                    queue.extend(entry["deps"])
+                else:
+                    pending[executor.submit(fetch_one, m, session, entry)] = m
+
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                m = pending.pop(future)
+                entry = future.result()
+                if entry is None:
+                    continue
+                entries[m] = entry
+                if cache is not None:
+                    cache[m] = entry
+                queue.extend(entry["deps"])
+
+    # Emit in breadth-first order so the output does not depend on which request finished first.
+    all_mods = []
+    seen = {mod_id}
+    order = deque([mod_id])
+    while order:
+        m = order.popleft()
+        if m not in entries:
+            continue
+        entry = entries[m]
+        all_mods.append({
+            "modId": m,
+            "name": entry["name"],
+            "version": ""  # Version information is currently not extracted.
+        })
+        for dependency_id in entry["deps"]:
+            if dependency_id not in seen:
+                seen.add(dependency_id)
+                order.append(dependency_id)
 
     return all_mods
 
@@ -85,10 +355,16 @@ def main():
 
     root_mod_id = sys.argv[1]
     visited_mods = set()
-    mods = fetch_mod_details(root_mod_id, visited_mods)
+    cache = load_cache()
+    mods = fetch_mod_details(root_mod_id, visited_mods, cache=cache)
+    save_cache(cache)
 
-    with open("mods.json", "w") as f:
-        json.dump(mods, f, indent=4)
+    if orjson is not None:
+        data = orjson.dumps(mods, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(mods, indent=2, ensure_ascii=False).encode("utf-8")
+    with open("mods.json", "wb") as f:
+        f.write(data)
 
     print("Mod details and dependencies saved to mods.json")
 
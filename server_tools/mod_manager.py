@@ -24,37 +24,73 @@ Output Files:
 
 import argparse
 import csv
+import html as html_lib
+import io
 import json
+import os
 import re
 import sys
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import requests
-import urllib3
 from bs4 import BeautifulSoup
-
-# Disable SSL verification warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from requests.adapters import HTTPAdapter
+
+# Use an HTTP/2 httpx client when httpx[http2] is installed
+try:
+    import httpx
+    import h2  # noqa: F401  (HTTP/2 support for httpx)
+except ImportError:
+    httpx = None  # Fall back to a pooled requests.Session over HTTP/1.1
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
+# Scan whole workshop pages with the linear-time RE2 engine when google-re2 is installed
+try:
+    import re2
+except ImportError:
+    re2 = None  # Fall back to the stdlib re engine
+
+# Prefer the C-backed lxml parser for workshop pages when it is installed
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_etree = None
+    lxml_html = None
 
 
 # =============================================================================
 # DATA MODELS AND UTILITY FUNCTIONS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModInfo:
-    """Data class to represent mod information."""
+    """Immutable, hashable data class to represent mod information."""
     name: str
     version: str
     mod_id: str
     source_file: str = ""
     size: str = ""  # Added size field for workshop mod information
+    size_bytes: int = field(init=False, repr=False, compare=False)  # Parsed once from size
+
+    def __post_init__(self):
+        object.__setattr__(self, 'size_bytes', size_to_bytes(self.size))
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonData:
     """Data structure for mod comparison results."""
     identical_mods: List[ModInfo]
@@ -63,26 +99,60 @@ class ComparisonData:
     unique_to_source2: List[ModInfo]
 
 
+# Compiled regex patterns for size strings: a whole-string size with an optional or
+# abbreviated unit (e.g., "5350b", "6M", "2.49 KB"), and a size embedded in other text
+SIZE_EXACT_PATTERN = re.compile(r'^\s*(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>[KMGT]?B?)\s*$', re.IGNORECASE)
+SIZE_PATTERN = re.compile(r'(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>KB|MB|GB|TB|B)', re.IGNORECASE)
+
+# Byte multipliers for every unit _parse_size can return
+SIZE_UNIT_MULTIPLIERS = {'B': 1, 'KB': 1 << 10, 'MB': 1 << 20, 'GB': 1 << 30, 'TB': 1 << 40}
+
+
+def _parse_size(size_str: str) -> Optional[Tuple[float, str]]:
+    """Parse a size string into (value, unit) with unit one of SIZE_UNIT_MULTIPLIERS, or None."""
+    size_match = SIZE_EXACT_PATTERN.match(size_str)
+    if size_match:
+        unit = size_match.group('unit').upper()
+        return float(size_match.group('value')), unit if unit.endswith('B') else unit + 'B'
+
+    size_match = SIZE_PATTERN.search(size_str)
+    if size_match:
+        return float(size_match.group('value')), size_match.group('unit').upper()
+
+    return None
+
+
+# RE2's \s and \d are ASCII-only; these classes match what Python's re accepts for str patterns
+_RE2_CLASSES = ((r'\s', r'[\s\v\x1c-\x1f\x85\p{Z}]'), (r'\d', r'\p{Nd}'))
+
+
+def _compile_page_pattern(pattern: str):
+    """Compile a case-insensitive pattern for scanning whole pages, using RE2 when available."""
+    if re2 is None:
+        return re.compile(pattern, re.IGNORECASE)
+    for python_class, re2_class in _RE2_CLASSES:
+        pattern = pattern.replace(python_class, re2_class)
+    return re2.compile(f'(?i){pattern}')
+
+
+@lru_cache(maxsize=4096)
 def size_to_bytes(size_str: str) -> int:
-    """Convert size string (e.g., '285.68 KB') to bytes."""
+    """Convert size string (e.g., '285.68 KB') to bytes (memoized; sizes repeat across mods)."""
     if not size_str:
         return 0
 
-    # Parse size string (e.g., "285.68 KB", "2.49 MB", "5350 B")
-    size_match = re.search(r'(\d+(?:\.\d+)?)\s*(KB|MB|GB|B)',
-                           size_str, re.IGNORECASE)
-    if size_match:
-        value = float(size_match.group(1))
-        unit = size_match.group(2).upper()
-
-        if unit == 'B':
-            return int(value)
-        if unit == 'KB':
-            return int(value * 1024)
-        if unit == 'MB':
-            return int(value * 1024 * 1024)
-        if unit == 'GB':
-            return int(value * 1024 * 1024 * 1024)
+    # Fast path for the normalized "<value> <UNIT>" format used throughout this module
+    value_str, _, unit = size_str.rpartition(' ')
+    multiplier = SIZE_UNIT_MULTIPLIERS.get(unit)
+    if multiplier is not None:
+        whole, dot, fraction = value_str.strip().partition('.')
+        if whole.isdecimal() and (not dot or fraction.isdecimal()):
+            return int(float(value_str) * multiplier)
+
+    parsed = _parse_size(size_str)
+    if parsed:
+        value, unit = parsed
+        return int(value * SIZE_UNIT_MULTIPLIERS[unit])
 
     return 0
 
@@ -102,7 +172,7 @@ class FileIOHandler:
         if self.verbose:
             print(message)
 
-    def write_csv_file(self, output_file: Path, mods: List[ModInfo],
+    def write_csv_file(self, output_file: Path, mods: Iterable[ModInfo],
                       include_header: bool = True,
                       include_source: bool = False) -> None:
         """
@@ -110,34 +180,28 @@ class FileIOHandler:
 
         Args:
             output_file: Path to output CSV file
-            mods: List of ModInfo objects
+            mods: ModInfo objects (iterated once, so a generator is fine)
             include_header: Whether to include header row
             include_source: Whether to include source file column
         """
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            if include_source:
-                fieldnames = ['Mod Name', 'Version', 'Mod ID', 'Size',
-                              'Size (Bytes)', 'Source File']
-            else:
-                fieldnames = ['Mod Name', 'Version', 'Mod ID', 'Size',
-                              'Size (Bytes)']
-
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
 
             if include_header:
-                writer.writeheader()
+                if include_source:
+                    writer.writerow(('Mod Name', 'Version', 'Mod ID', 'Size',
+                                     'Size (Bytes)', 'Source File'))
+                else:
+                    writer.writerow(('Mod Name', 'Version', 'Mod ID', 'Size',
+                                     'Size (Bytes)'))
 
             for mod in mods:
-                row = {
-                    'Mod Name': mod.name,
-                    'Version': mod.version,
-                    'Mod ID': mod.mod_id,
-                    'Size': mod.size,
-                    'Size (Bytes)': size_to_bytes(mod.size)
-                }
                 if include_source:
-                    row['Source File'] = mod.source_file
-                writer.writerow(row)
+                    writer.writerow((mod.name, mod.version, mod.mod_id, mod.size,
+                                     mod.size_bytes, mod.source_file))
+                else:
+                    writer.writerow((mod.name, mod.version, mod.mod_id, mod.size,
+                                     mod.size_bytes))
 
 # =============================================================================
 # DATA FORMATTING AND UTILITY CLASSES
@@ -149,8 +213,13 @@ class DataFormatter:
     # Compiled regex patterns for better performance
     FILENAME_CHARS_PATTERN = re.compile(r'[^\w\s-]')
     WHITESPACE_PATTERN = re.compile(r'\s+')
+    UNSAFE_FILENAME_PATTERN = re.compile(r'[^\w \-]')  # \w is exactly str.isalnum() plus '_'
+
+    # Taken once per run so every output file from one run shares the same timestamp
+    RUN_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_size_format(size_str: str) -> str:
         """
         Normalize size format for Excel sorting compatibility.
@@ -167,54 +236,21 @@ class DataFormatter:
 
         size_str = size_str.strip()
 
-        size_match = re.match(r'^(\d+(?:\.\d+)?)\s*([KMGTkmgt]?[Bb]?)$', size_str)
-
-        if size_match:
-            value_str = size_match.group(1)
-            unit = size_match.group(2).upper() if size_match.group(2) else 'B'
-
-            value = float(value_str)
-
-            if unit == 'B' or unit == '':
-                unit = 'B'
-            elif unit == 'KB' or unit == 'K':
-                unit = 'KB'
-            elif unit == 'MB' or unit == 'M':
-                unit = 'MB'
-            elif unit == 'GB' or unit == 'G':
-                unit = 'GB'
-            elif unit == 'TB' or unit == 'T':
-                unit = 'TB'
-            else:
-                unit = 'B'  # Default fallback
+        parsed = _parse_size(size_str)
+        if parsed:
+            value, unit = parsed
 
             if value == int(value):
                 return f"{int(value)} {unit}"
 
             return f"{value:.2f} {unit}".rstrip('0').rstrip('.')
 
-        size_patterns = [
-            r'(\d+(?:\.\d+)?)\s*(KB|MB|GB|TB|B)',
-            r'(\d+(?:\.\d+)?)\s*(kb|mb|gb|tb|b)',
-        ]
-
-        for pattern in size_patterns:
-            match = re.search(pattern, size_str, re.IGNORECASE)
-            if match:
-                value = float(match.group(1))
-                unit = match.group(2).upper()
-
-                if value == int(value):
-                    return f"{int(value)} {unit}"
-
-                return f"{value:.2f} {unit}".rstrip('0').rstrip('.')
-
         return size_str
 
     @staticmethod
     def create_safe_filename(name: str) -> str:
         """Create a safe filename from a source name."""
-        return "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        return DataFormatter.UNSAFE_FILENAME_PATTERN.sub('', name).rstrip()
 
     @staticmethod
     def generate_timestamped_filename(prefix: str, suffix: str = "", extension: str = "csv") -> str:
@@ -229,22 +265,17 @@ class DataFormatter:
         Returns:
             Filename in format: {prefix}_{suffix}_{timestamp}.{extension}
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = DataFormatter.RUN_TIMESTAMP
 
         # Sanitize prefix
         safe_prefix = DataFormatter.create_safe_filename(prefix)
         if not safe_prefix:
             safe_prefix = "output"
 
-        # Build filename parts
-        parts = [safe_prefix]
-        if suffix:
-            safe_suffix = DataFormatter.create_safe_filename(suffix)
-            if safe_suffix:
-                parts.append(safe_suffix)
-        parts.append(timestamp)
-
-        return f"{'_'.join(parts)}.{extension}"
+        safe_suffix = DataFormatter.create_safe_filename(suffix) if suffix else ""
+        if safe_suffix:
+            return f"{safe_prefix}_{safe_suffix}_{timestamp}.{extension}"
+        return f"{safe_prefix}_{timestamp}.{extension}"
 
     @staticmethod
     def generate_server_filename(server_name: str, server_id: str) -> str:
@@ -284,21 +315,18 @@ class DataFormatter:
         return DataFormatter.generate_timestamped_filename(prefix)
 
     @staticmethod
-    def calculate_total_size(mods: List[ModInfo]) -> str:
+    def calculate_total_size(mods: Iterable[ModInfo]) -> str:
         """Calculate total size from a list of mods with size information."""
-        total_bytes = sum(size_to_bytes(mod.size) for mod in mods if mod.size)
+        total_bytes = sum(mod.size_bytes for mod in mods)
 
         if total_bytes == 0:
             return ""
 
-        if total_bytes >= 1024 * 1024 * 1024:
-            return f"{total_bytes / (1024 * 1024 * 1024):.2f} GB"
-        if total_bytes >= 1024 * 1024:
-            return f"{total_bytes / (1024 * 1024):.2f} MB"
-        if total_bytes >= 1024:
-            return f"{total_bytes / 1024:.2f} KB"
-        else:
-            return f"{total_bytes:.0f} B"
+        # Each 10 bits of the total is one unit step up from bytes, capped at GB
+        shift = min((total_bytes.bit_length() - 1) // 10 * 10, 30)
+        if shift == 0:
+            return f"{total_bytes} B"
+        return f"{total_bytes / (1 << shift):.2f} {('KB', 'MB', 'GB')[shift // 10 - 1]}"
 
 
 # =============================================================================
@@ -308,18 +336,30 @@ class DataFormatter:
 class HTTPClient:
     """Handles HTTP requests and API communications."""
 
+    POOL_SIZE = 20  # Keep-alive connections shared by concurrent requests
+
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
+        self._session = None
 
     def log(self, message: str) -> None:
         """Log message if verbose mode is enabled."""
         if self.verbose:
             print(message)
 
-    def get_http_session(self) -> requests.Session:
-        """Create a standardized HTTP session with consistent headers."""
-        session = requests.Session()
-        session.headers.update({
+    def get_http_session(self):
+        """
+        Return the shared HTTP session, creating it with consistent headers on first use.
+
+        The session is an HTTP/2 httpx.Client when httpx[http2] is installed, so the
+        BattleMetrics and concurrent workshop requests share multiplexed connections;
+        otherwise a requests.Session with a connection pool sized for the workshop
+        fetch threads.
+        """
+        if self._session is not None:
+            return self._session
+
+        headers = {
             'User-Agent': ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
                            'AppleWebKit/537.36 (KHTML, like Gecko) '
                            'Chrome/91.0.4472.124 Safari/537.36'),
@@ -328,9 +368,22 @@ class HTTPClient:
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
             'DNT': '1',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
-        })
+        }
+
+        if httpx is not None:
+            session = httpx.Client(
+                http2=True, headers=headers, follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.POOL_SIZE,
+                                    max_keepalive_connections=self.POOL_SIZE))
+        else:
+            session = requests.Session()
+            session.headers.update(headers)
+            session.headers['Connection'] = 'keep-alive'
+            adapter = HTTPAdapter(pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        self._session = session
         return session
 
     def make_http_request(self, url: str, expect_json: bool = False,
@@ -349,11 +402,10 @@ class HTTPClient:
         self.log(f"Making HTTP request to: {url}")
 
         session = self.get_http_session()
-        if expect_json:
-            session.headers['Accept'] = 'application/json'
+        headers = {'Accept': 'application/json'} if expect_json else None
 
         try:
-            response = session.get(url, timeout=timeout, verify=False)
+            response = session.get(url, headers=headers, timeout=timeout)
             self.log(f"HTTP response status: {response.status_code}")
             self.log(f"HTTP response length: {len(response.text)}")
 
@@ -369,7 +421,7 @@ class HTTPClient:
 
             if expect_json:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content) if orjson is not None else response.json()
                     self.log("Successfully parsed JSON response")
                     return True, data
                 except (json.JSONDecodeError, requests.exceptions.JSONDecodeError, ValueError) as json_error:
@@ -408,6 +460,8 @@ class BattleMetricsAPI:
     BRACKET_PATTERN = re.compile(r'^\[([^\]]+)\]\s*(.*)')
     SERVER_SUFFIX_PATTERN = re.compile(r'\s*[-/|]\s*.*$')
     SERVER_PREFIX_PATTERN = re.compile(r'^\[.*?\]\s*')
+    CLEAN_NAME_PATTERN = re.compile(r'[\w \-]{1,50}')  # Already filename-safe and short enough
+    SERVER_NAME_INDICATORS = ('discord', 'ts3', 'teamspeak', 'www.', 'http', '|')
 
     def __init__(self, http_client: HTTPClient, api_base_url: str = "https://api.battlemetrics.com"):
         self.http_client = http_client
@@ -419,13 +473,14 @@ class BattleMetricsAPI:
         success, data = self.http_client.make_http_request(api_url, expect_json=True)
         return data if success else {}
 
-    def extract_server_name_from_api_data(self, api_data: dict) -> str:
-        """Extract and sanitize server name from BattleMetrics API response."""
-        server_data = api_data.get('data', {})
-        attributes = server_data.get('attributes', {})
-        details = attributes.get('details', {})
-        reforger_data = details.get('reforger', {})
+    @staticmethod
+    def _reforger(api_data: dict) -> Tuple[dict, dict]:
+        """Walk a BattleMetrics API response once, returning (attributes, reforger details)."""
+        attributes = api_data.get('data', {}).get('attributes', {})
+        return attributes, attributes.get('details', {}).get('reforger', {})
 
+    def extract_server_name_from_api_data(self, attributes: dict, reforger_data: dict) -> str:
+        """Extract and sanitize server name from the attributes and reforger details of an API response."""
         scenario_name_raw = reforger_data.get('scenarioName', '')
 
         if self.http_client.verbose:
@@ -443,12 +498,8 @@ class BattleMetricsAPI:
                 self.http_client.log(f"No scenario found, using server name: '{server_name_raw}' -> '{server_name}'")
             return server_name
 
-    def extract_mods_from_api_data(self, api_data: dict, source_name: str) -> List[ModInfo]:
-        """Extract mod list from BattleMetrics API response."""
-        server_data = api_data.get('data', {})
-        attributes = server_data.get('attributes', {})
-        details = attributes.get('details', {})
-        reforger_data = details.get('reforger', {})
+    def extract_mods_from_api_data(self, reforger_data: dict, source_name: str) -> List[ModInfo]:
+        """Extract mod list from the reforger details of a BattleMetrics API response."""
         mod_list = reforger_data.get('mods', [])
 
         self.http_client.log(f"Found {len(mod_list)} mods in API response")
@@ -480,6 +531,12 @@ class BattleMetricsAPI:
         if not server_name:
             return ""
 
+        # Fast path: a clean name (most scenario names) only needs its spaces folded to underscores
+        is_server_name = any(indicator in server_name.lower() for indicator in self.SERVER_NAME_INDICATORS)
+        if not is_server_name and self.CLEAN_NAME_PATTERN.fullmatch(server_name):
+            name = '_'.join(server_name.split()).strip('_')
+            return name if name else "Unknown_Server"
+
         name = server_name
 
         # For scenario names with brackets, preserve the content inside brackets
@@ -490,7 +547,7 @@ class BattleMetricsAPI:
             name = f"{prefix}_{suffix}" if suffix else prefix
 
         # Remove server-specific patterns only if it looks like a server name (not a scenario)
-        if not bracket_match and any(indicator in name.lower() for indicator in ['discord', 'ts3', 'teamspeak', 'www.', 'http', '|']):
+        if not bracket_match and any(indicator in name.lower() for indicator in self.SERVER_NAME_INDICATORS):
             name = self.SERVER_SUFFIX_PATTERN.sub('', name)
             name = self.SERVER_PREFIX_PATTERN.sub('', name)
 
@@ -513,11 +570,14 @@ class BattleMetricsAPI:
             if not api_data:
                 return [], ""
 
+            # Walk the response once and share the nested dicts between both extractors
+            attributes, reforger_data = self._reforger(api_data)
+
             # Extract server name using consolidated method
-            server_name = self.extract_server_name_from_api_data(api_data)
+            server_name = self.extract_server_name_from_api_data(attributes, reforger_data)
 
             # Extract mods using consolidated method
-            mods = self.extract_mods_from_api_data(api_data, server_name or f"BattleMetrics:{server_id}")
+            mods = self.extract_mods_from_api_data(reforger_data, server_name or f"BattleMetrics:{server_id}")
 
             if not mods:
                 print("Warning: No mod data found from BattleMetrics API.")
@@ -545,64 +605,131 @@ class BattleMetricsAPI:
 class WorkshopEnrichment:
     """Handles Steam Workshop data enrichment."""
 
-    def __init__(self, http_client: HTTPClient, workshop_base_url: str = "https://reforger.armaplatform.com/workshop"):
+    # Compiled regex patterns for better performance
+    MOD_SIZE_PATTERNS = (
+        _compile_page_pattern(r'(\d+(?:\.\d+)?\s*(?:MB|GB|KB|B))'),
+        _compile_page_pattern(r'Size:\s*(\d+(?:\.\d+)?\s*(?:MB|GB|KB|B))'),
+        _compile_page_pattern(r'Download:\s*(\d+(?:\.\d+)?\s*(?:MB|GB|KB|B))'),
+    )
+    MOD_SIZE_TEXT_PATTERN = _compile_page_pattern(r'\d+(?:\.\d+)?\s*(?:MB|GB|KB|B)')
+    OG_META_PATTERN = re.compile(
+        r'<meta\s[^>]*?property=(["\'])(?-i:og:)([\w:]+)\1[^>]*?content=(["\'])(.*?)\3', re.IGNORECASE | re.DOTALL)
+    # Visible text only, matching BeautifulSoup.get_text() (no script/style/template contents)
+    VISIBLE_TEXT_XPATH = '//text()[not(ancestor::script or ancestor::style or ancestor::template)]'
+
+    # Persistent cache of workshop details shared across runs
+    DEFAULT_CACHE_FILE = Path.home() / '.cache' / 'armareforger' / 'workshop_cache.json'
+    DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60  # Seconds before a cached mod is fetched again
+
+    def __init__(self, http_client: HTTPClient, workshop_base_url: str = "https://reforger.armaplatform.com/workshop",
+                 max_workers: int = 16, cache_file: Optional[Path] = DEFAULT_CACHE_FILE,
+                 cache_ttl: int = DEFAULT_CACHE_TTL):
         self.http_client = http_client
         self.workshop_base_url = workshop_base_url.rstrip('/')  # Remove trailing slash if present
+        self.max_workers = max_workers  # Concurrent workshop page fetches
+        self.cache_file = cache_file  # None disables the disk cache
+        self.cache_ttl = cache_ttl
         self.workshop_cache = {}  # mod_id -> ModInfo
         self.workshop_fetch_attempts = set()  # mod_ids that we've attempted
+        self._cache_lock = threading.Lock()  # Guards the cache and attempts set across fetch threads
+        self._disk_cache = self.load_disk_cache()  # mod_id -> {"name", "size", "fetched_at"}
+        self._disk_cache_dirty = False
+
+        # Seed the in-memory cache with every entry that is still fresh
+        now = time.time()
+        for mod_id, entry in self._disk_cache.items():
+            if now - entry['fetched_at'] < self.cache_ttl:
+                self.workshop_cache[mod_id] = ModInfo(entry['name'], "", mod_id, "workshop", entry['size'])
+
+    def load_disk_cache(self) -> Dict[str, dict]:
+        """Load persisted workshop details, returning an empty cache if missing or unreadable."""
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as error:
+            if self.cache_file.exists():
+                self.http_client.log(f"Ignoring unreadable workshop cache {self.cache_file}: {error}")
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            mod_id: entry for mod_id, entry in data.items()
+            if isinstance(entry, dict) and {'name', 'size', 'fetched_at'} <= entry.keys()
+            and isinstance(entry['fetched_at'], (int, float))
+        }
+
+    def save_disk_cache(self) -> None:
+        """Persist workshop details fetched this run, dropping expired entries."""
+        if self.cache_file is None or not self._disk_cache_dirty:
+            return
+        now = time.time()
+        entries = {mod_id: entry for mod_id, entry in self._disk_cache.items()
+                   if now - entry['fetched_at'] < self.cache_ttl}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp_file, self.cache_file)
+            self._disk_cache_dirty = False
+            self.http_client.log(f"Saved {len(entries)} workshop cache entries to {self.cache_file}")
+        except OSError as error:
+            self.http_client.log(f"Failed to save workshop cache: {error}")
 
     def extract_workshop_meta_content(self, html: str, meta_name: str) -> str:
         """Extract meta content from workshop HTML."""
+        # Scan the raw HTML first; only build a DOM for unusual attribute orders
+        for match in self.OG_META_PATTERN.finditer(html):
+            if match.group(2) == meta_name:
+                return html_lib.unescape(match.group(4))
+
         soup = BeautifulSoup(html, 'html.parser')
         meta_tag = soup.find("meta", {"property": f"og:{meta_name}"})
         return meta_tag["content"] if meta_tag else ""
 
     def extract_mod_size(self, html: str) -> str:
         """Extract mod size from workshop HTML and normalize format for Excel."""
-        soup = BeautifulSoup(html, 'html.parser')
-
-        size_patterns = [
-            r'(\d+(?:\.\d+)?\s*(?:MB|GB|KB|B))',
-            r'Size:\s*(\d+(?:\.\d+)?\s*(?:MB|GB|KB|B))',
-            r'Download:\s*(\d+(?:\.\d+)?\s*(?:MB|GB|KB|B))',
-        ]
+        tree = None
+        if lxml_html is not None:
+            try:
+                tree = lxml_html.fromstring(html)
+            except (ValueError, lxml_etree.ParserError):
+                tree = None
+
+        if tree is not None:
+            page_text = ''.join(tree.xpath(self.VISIBLE_TEXT_XPATH))
+        else:
+            page_text = BeautifulSoup(html, 'html.parser').get_text()
 
-        page_text = soup.get_text()
-        for pattern in size_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        for pattern in self.MOD_SIZE_PATTERNS:
+            match = pattern.search(page_text)
             if match:
                 raw_size = match.group(1)
                 return DataFormatter.normalize_size_format(raw_size)
 
-        size_elements = soup.find_all(text=re.compile(r'\d+(?:\.\d+)?\s*(?:MB|GB|KB|B)', re.IGNORECASE))
-        if size_elements:
-            for element in size_elements:
-                match = re.search(r'\d+(?:\.\d+)?\s*(?:MB|GB|KB|B)', element, re.IGNORECASE)
-                if match:
-                    raw_size = match.group()
-                    return DataFormatter.normalize_size_format(raw_size)
+        # Fall back to the raw HTML, which also covers sizes embedded in scripts
+        match = self.MOD_SIZE_TEXT_PATTERN.search(html)
+        if match:
+            return DataFormatter.normalize_size_format(match.group())
 
         return ""
 
     def fetch_workshop_mod_details(self, mod_id: str) -> List[ModInfo]:
         """Fetch mod details from Arma Reforger workshop with caching."""
         if mod_id in self.workshop_cache:
-            self.http_client.log(f"Cache hit for mod {mod_id}: {self.workshop_cache[mod_id].name}")
             cached_mod = self.workshop_cache[mod_id]
-            return [ModInfo(
-                name=cached_mod.name,
-                version=cached_mod.version,
-                mod_id=cached_mod.mod_id,
-                source_file=cached_mod.source_file,
-                size=cached_mod.size
-            )]
+            self.http_client.log(f"Cache hit for mod {mod_id}: {cached_mod.name}")
+            return [cached_mod]  # ModInfo is frozen, so sharing the cached instance is safe
 
         if mod_id in self.workshop_fetch_attempts:
             self.http_client.log(f"Previously failed to fetch mod {mod_id}, skipping")
             return []
 
         url = f"{self.workshop_base_url}/{mod_id}"
-        self.workshop_fetch_attempts.add(mod_id)
+        with self._cache_lock:
+            self.workshop_fetch_attempts.add(mod_id)
 
         success, html = self.http_client.make_http_request(url, expect_json=False, timeout=10)
         if not success:
@@ -621,7 +748,11 @@ class WorkshopEnrichment:
                 size=DataFormatter.normalize_size_format(mod_size) if mod_size else ""
             )
 
-            self.workshop_cache[mod_id] = mod_data
+            with self._cache_lock:
+                self.workshop_cache[mod_id] = mod_data
+                self._disk_cache[mod_id] = {'name': mod_data.name, 'size': mod_data.size,
+                                            'fetched_at': int(time.time())}
+                self._disk_cache_dirty = True
             self.http_client.log(f"Cached workshop data for mod {mod_id}: {mod_data.name}")
 
             return [mod_data]
@@ -640,24 +771,33 @@ class WorkshopEnrichment:
         total_mods = len(mods)
         self.http_client.log(f"Starting enrichment for {total_mods} mods...")
 
+        # Fetch every uncached workshop page concurrently; the loop below then
+        # only reads from the cache
+        to_fetch = list(dict.fromkeys(
+            mod.mod_id for mod in mods
+            if mod.mod_id not in self.workshop_cache and mod.mod_id not in self.workshop_fetch_attempts
+        ))
+        if to_fetch:
+            self.http_client.log(f"Fetching {len(to_fetch)} workshop pages with up to {self.max_workers} threads...")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(self.fetch_workshop_mod_details, to_fetch))
+            self.save_disk_cache()
+        fetched_now = set(to_fetch)  # First occurrence of each counts as a new fetch
+
         for i, mod in enumerate(mods, 1):
             if self.http_client.verbose:
                 print(f"  [{i}/{total_mods}] Enriching {mod.name} (ID: {mod.mod_id})...")
             else:
                 self.http_client.log(f"Enriching mod {mod.name} (ID: {mod.mod_id})...")
 
-            was_cached = mod.mod_id in self.workshop_cache
+            was_cached = mod.mod_id in self.workshop_cache and mod.mod_id not in fetched_now
+            fetched_now.discard(mod.mod_id)
 
             workshop_mods = self.fetch_workshop_mod_details(mod.mod_id)
             if workshop_mods:
                 workshop_mod = workshop_mods[0]
-                enriched_mod = ModInfo(
-                    name=mod.name,
-                    version=mod.version,
-                    mod_id=mod.mod_id,
-                    source_file=mod.source_file,
-                    size=DataFormatter.normalize_size_format(workshop_mod.size) if workshop_mod.size else ""
-                )
+                enriched_mod = replace(
+                    mod, size=DataFormatter.normalize_size_format(workshop_mod.size) if workshop_mod.size else "")
                 enriched_mods.append(enriched_mod)
 
                 if was_cached:
@@ -701,10 +841,11 @@ class ModComparison:
         Returns:
             Tuple of (identical_mods, version_diff_mods, unique_to_source1, unique_to_source2)
         """
-        # Find different categories of mods
-        common_mod_names = set(mods1_dict.keys()) & set(mods2_dict.keys())
-        unique_to_source1 = set(mods1_dict.keys()) - set(mods2_dict.keys())
-        unique_to_source2 = set(mods2_dict.keys()) - set(mods1_dict.keys())
+        # Find different categories of mods (dict key views support set operations directly)
+        keys1, keys2 = mods1_dict.keys(), mods2_dict.keys()
+        common_mod_names = keys1 & keys2
+        unique_to_source1 = keys1 - keys2
+        unique_to_source2 = keys2 - keys1
 
         # Analyze common mods
         identical_mods = []
@@ -714,10 +855,7 @@ class ModComparison:
             mod1 = mods1_dict[mod_name]
             mod2 = mods2_dict[mod_name]
 
-            version_match = mod1.version == mod2.version
-            id_match = mod1.mod_id == mod2.mod_id
-
-            if version_match and id_match:
+            if mod1.version == mod2.version and mod1.mod_id == mod2.mod_id:
                 identical_mods.append(mod1)
             else:
                 # Any difference (version or ID) goes into version_diff_mods
@@ -734,8 +872,6 @@ class ModComparison:
         Returns:
             Tuple of (common_mods_data, fieldnames)
         """
-        common_mods_data = []
-
         # Create column names using actual scenario names
         source1_column = f"{source1_name} Version"
         source2_column = f"{source2_name} Version"
@@ -743,44 +879,61 @@ class ModComparison:
         # Base fieldnames
         fieldnames = ['Mod Name', 'Status', 'Version', 'Mod ID', 'Size', 'Size (Bytes)', source1_column, source2_column]
 
+        # Pick the row shape once so each comprehension stays branch-free
         if include_size_columns:
             source1_size_column = f"{source1_name} Size"
             source2_size_column = f"{source2_name} Size"
             fieldnames.extend([source1_size_column, source2_size_column])
-        else:
-            source1_size_column = source2_size_column = None
 
-        # Add identical mods
-        for mod in comparison_data.identical_mods:
-            row = {
+            identical_rows = [{
                 'Mod Name': mod.name,
                 'Status': 'Identical',
                 'Version': mod.version,
                 'Mod ID': mod.mod_id,
                 'Size': mod.size,
+                'Size (Bytes)': mod.size_bytes,
+                source1_column: mod.version,
+                source2_column: mod.version,
+                source1_size_column: mod.size,
+                source2_size_column: mod.size
+            } for mod in comparison_data.identical_mods]
+
+            version_diff_rows = [{
+                'Mod Name': mod1.name,
+                'Status': 'Version Diff',
+                'Version': f"{mod1.version} → {mod2.version}",
+                'Mod ID': mod1.mod_id,
+                'Size': mod1.size or mod2.size,
+                'Size (Bytes)': mod1.size_bytes if mod1.size else mod2.size_bytes,
+                source1_column: mod1.version,
+                source2_column: mod2.version,
+                source1_size_column: mod1.size,
+                source2_size_column: mod2.size
+            } for mod1, mod2 in comparison_data.version_diff_mods]
+        else:
+            identical_rows = [{
+                'Mod Name': mod.name,
+                'Status': 'Identical',
+                'Version': mod.version,
+                'Mod ID': mod.mod_id,
+                'Size': mod.size,
+                'Size (Bytes)': mod.size_bytes,
                 source1_column: mod.version,
                 source2_column: mod.version
-            }
-            if include_size_columns:
-                row[source1_size_column] = mod.size
-                row[source2_size_column] = mod.size
-            common_mods_data.append(row)
-
-        # Add version diff mods
-        for mod1, mod2 in comparison_data.version_diff_mods:
-            row = {
+            } for mod in comparison_data.identical_mods]
+
+            version_diff_rows = [{
                 'Mod Name': mod1.name,
                 'Status': 'Version Diff',
                 'Version': f"{mod1.version} → {mod2.version}",
                 'Mod ID': mod1.mod_id,
                 'Size': mod1.size or mod2.size,
+                'Size (Bytes)': mod1.size_bytes if mod1.size else mod2.size_bytes,
                 source1_column: mod1.version,
                 source2_column: mod2.version
-            }
-            if include_size_columns:
-                row[source1_size_column] = mod1.size
-                row[source2_size_column] = mod2.size
-            common_mods_data.append(row)
+            } for mod1, mod2 in comparison_data.version_diff_mods]
+
+        common_mods_data = identical_rows + version_diff_rows
 
         return common_mods_data, fieldnames
 
@@ -795,99 +948,122 @@ class ReportGenerator:
     def __init__(self, file_io: FileIOHandler):
         self.file_io = file_io
 
+    @staticmethod
+    def _name_column_width(identical_mods: List[ModInfo],
+                           version_diff_mods: List[Tuple[ModInfo, ModInfo]]) -> int:
+        """Width of the mod name column: the longest mod name in the report, computed once for all rows."""
+        names = chain(map(attrgetter('name'), identical_mods), (mod1.name for mod1, _ in version_diff_mods))
+        return max(map(len, names))
+
+    @staticmethod
+    def _write_report(lines: List[str]) -> None:
+        """Write report lines to stdout with a single write and one flush."""
+        out = sys.stdout
+        out.write("\n".join(lines) + "\n")
+        out.flush()
+
     def print_comparison_results(self, source1_name: str, source2_name: str,
                                 comparison_data: ComparisonData,
                                 mods1_dict: Dict[str, ModInfo],
                                 mods2_dict: Dict[str, ModInfo]) -> None:
         """Print detailed comparison results."""
+        identical_mods = comparison_data.identical_mods
+        version_diff_mods = comparison_data.version_diff_mods
 
-        print("MODS WITH IDENTICAL VERSIONS AND IDs:")
-        print("-" * 50)
-        if comparison_data.identical_mods:
-            for mod in comparison_data.identical_mods:
-                print(f"  {mod.name:<40} | v{mod.version:<12} | {mod.mod_id}")
+        # Collect the whole report and write it once instead of one print() per line
+        lines = ["MODS WITH IDENTICAL VERSIONS AND IDs:", "-" * 50]
+        if identical_mods:
+            name_width = self._name_column_width(identical_mods, version_diff_mods)
+            lines.extend(f"  {mod.name.ljust(name_width)} | v{mod.version.ljust(12)} | {mod.mod_id}"
+                         for mod in identical_mods)
         else:
-            print("  None")
-        print()
+            lines.append("  None")
+        lines.append("")
 
-        print("MODS WITH DIFFERENT VERSIONS:")
-        print("-" * 50)
-        if comparison_data.version_diff_mods:
-            for mod1, mod2 in comparison_data.version_diff_mods:
-                print(f"  {mod1.name:<40}")
-                print(f"    {source1_name:<30}: v{mod1.version:<12} | {mod1.mod_id}")
-                print(f"    {source2_name:<30}: v{mod2.version:<12} | {mod2.mod_id}")
+        lines += ["MODS WITH DIFFERENT VERSIONS:", "-" * 50]
+        if version_diff_mods:
+            source1_label = f"    {source1_name.ljust(30)}: v"  # Padded once, not per mod
+            source2_label = f"    {source2_name.ljust(30)}: v"
+            for mod1, mod2 in version_diff_mods:
+                lines.append(f"  {mod1.name}")  # Nothing follows the name, so no padding
+                lines.append(f"{source1_label}{mod1.version.ljust(12)} | {mod1.mod_id}")
+                lines.append(f"{source2_label}{mod2.version.ljust(12)} | {mod2.mod_id}")
                 if mod1.mod_id != mod2.mod_id:
-                    print("    ⚠️  Different Mod IDs!")
-                print()
+                    lines.append("    ⚠️  Different Mod IDs!")
+                lines.append("")
         else:
-            print("  None")
-        print()
+            lines.append("  None")
+        lines.append("")
 
         # Summary statistics
-        print("SUMMARY:")
-        print("-" * 20)
-        print(f"Total mods in {source1_name}: {len(mods1_dict)}")
-        print(f"Total mods in {source2_name}: {len(mods2_dict)}")
-        print(f"Common mods: {len(comparison_data.identical_mods) + len(comparison_data.version_diff_mods)}")
-        print(f"  - Identical (same version & ID): {len(comparison_data.identical_mods)}")
-        print(f"  - Different versions: {len(comparison_data.version_diff_mods)}")
-        print(f"Unique to {source1_name}: {len(comparison_data.unique_to_source1)}")
-        print(f"Unique to {source2_name}: {len(comparison_data.unique_to_source2)}")
-        print()
+        lines += [
+            "SUMMARY:",
+            "-" * 20,
+            f"Total mods in {source1_name}: {len(mods1_dict)}",
+            f"Total mods in {source2_name}: {len(mods2_dict)}",
+            f"Common mods: {len(identical_mods) + len(version_diff_mods)}",
+            f"  - Identical (same version & ID): {len(identical_mods)}",
+            f"  - Different versions: {len(version_diff_mods)}",
+            f"Unique to {source1_name}: {len(comparison_data.unique_to_source1)}",
+            f"Unique to {source2_name}: {len(comparison_data.unique_to_source2)}",
+            "",
+        ]
+        self._write_report(lines)
 
     def print_enriched_comparison_results(self, source1_name: str, source2_name: str, identical_mods: List[ModInfo],
                                          version_diff_mods: List[Tuple[ModInfo, ModInfo]],
                                          unique_to_source1: Set[str], unique_to_source2: Set[str],
                                          mods1_dict: Dict[str, ModInfo], mods2_dict: Dict[str, ModInfo]) -> None:
         """Print detailed comparison results with size information."""
-
-        print("MODS WITH IDENTICAL VERSIONS AND IDs:")
-        print("-" * 50)
+        # Collect the whole report and write it once instead of one print() per line
+        lines = ["MODS WITH IDENTICAL VERSIONS AND IDs:", "-" * 50]
         if identical_mods:
-            for mod in identical_mods:
-                size_info = f" | {mod.size}" if mod.size else ""
-                print(f"  {mod.name:<40} | v{mod.version:<12} | {mod.mod_id}{size_info}")
+            name_width = self._name_column_width(identical_mods, version_diff_mods)
+            lines.extend(f"  {mod.name.ljust(name_width)} | v{mod.version.ljust(12)} | {mod.mod_id}{f' | {mod.size}' if mod.size else ''}"
+                         for mod in identical_mods)
         else:
-            print("  None")
-        print()
+            lines.append("  None")
+        lines.append("")
 
-        print("MODS WITH DIFFERENT VERSIONS:")
-        print("-" * 50)
+        lines += ["MODS WITH DIFFERENT VERSIONS:", "-" * 50]
         if version_diff_mods:
+            source1_label = f"    {source1_name.ljust(30)}: v"  # Padded once, not per mod
+            source2_label = f"    {source2_name.ljust(30)}: v"
             for mod1, mod2 in version_diff_mods:
-                print(f"  {mod1.name:<40}")
+                lines.append(f"  {mod1.name}")  # Nothing follows the name, so no padding
                 size1_info = f" | {mod1.size}" if mod1.size else ""
                 size2_info = f" | {mod2.size}" if mod2.size else ""
-                print(f"    {source1_name:<30}: v{mod1.version:<12} | {mod1.mod_id}{size1_info}")
-                print(f"    {source2_name:<30}: v{mod2.version:<12} | {mod2.mod_id}{size2_info}")
+                lines.append(f"{source1_label}{mod1.version.ljust(12)} | {mod1.mod_id}{size1_info}")
+                lines.append(f"{source2_label}{mod2.version.ljust(12)} | {mod2.mod_id}{size2_info}")
                 if mod1.mod_id != mod2.mod_id:
-                    print("    ⚠️  Different Mod IDs!")
-                print()
+                    lines.append("    ⚠️  Different Mod IDs!")
+                lines.append("")
         else:
-            print("  None")
-        print()
+            lines.append("  None")
+        lines.append("")
+
+        lines += [
+            "SUMMARY:",
+            "-" * 20,
+            f"Total mods in {source1_name}: {len(mods1_dict)}",
+            f"Total mods in {source2_name}: {len(mods2_dict)}",
+            f"Common mods: {len(identical_mods) + len(version_diff_mods)}",
+            f"  - Identical (same version & ID): {len(identical_mods)}",
+            f"  - Different versions: {len(version_diff_mods)}",
+            f"Unique to {source1_name}: {len(unique_to_source1)}",
+            f"Unique to {source2_name}: {len(unique_to_source2)}",
+        ]
 
-        print("SUMMARY:")
-        print("-" * 20)
-        print(f"Total mods in {source1_name}: {len(mods1_dict)}")
-        print(f"Total mods in {source2_name}: {len(mods2_dict)}")
-        print(f"Common mods: {len(identical_mods) + len(version_diff_mods)}")
-        print(f"  - Identical (same version & ID): {len(identical_mods)}")
-        print(f"  - Different versions: {len(version_diff_mods)}")
-        print(f"Unique to {source1_name}: {len(unique_to_source1)}")
-        print(f"Unique to {source2_name}: {len(unique_to_source2)}")
-
-        if any(mod.size for mod in mods1_dict.values()):
-            total_size1 = DataFormatter.calculate_total_size([mod for mod in mods1_dict.values() if mod.size])
-            if total_size1:
-                print(f"Total size for {source1_name}: {total_size1}")
-
-        if any(mod.size for mod in mods2_dict.values()):
-            total_size2 = DataFormatter.calculate_total_size([mod for mod in mods2_dict.values() if mod.size])
-            if total_size2:
-                print(f"Total size for {source2_name}: {total_size2}")
-        print()
+        # Mods without a size contribute 0 bytes, so each dict is summed in a single pass
+        total_size1 = DataFormatter.calculate_total_size(mods1_dict.values())
+        if total_size1:
+            lines.append(f"Total size for {source1_name}: {total_size1}")
+
+        total_size2 = DataFormatter.calculate_total_size(mods2_dict.values())
+        if total_size2:
+            lines.append(f"Total size for {source2_name}: {total_size2}")
+        lines.append("")
+        self._write_report(lines)
 
     def write_unique_files(self, output_dir: Path, source1_name: str, source2_name: str,
                            unique_to_source1: Set[str], unique_to_source2: Set[str],
@@ -896,14 +1072,14 @@ class ReportGenerator:
         if unique_to_source1:
             unique_filename1 = DataFormatter.generate_comparison_filename("unique_to", source1_name)
             unique_file1 = output_dir / unique_filename1
-            unique_mods1 = [mods1_dict[name] for name in unique_to_source1]
+            unique_mods1 = (mods1_dict[name] for name in unique_to_source1)
             self.file_io.write_csv_file(unique_file1, unique_mods1, include_source=True)
             print(f"✅ Unique mods from {source1_name} saved to: {unique_file1.name}")
 
         if unique_to_source2:
             unique_filename2 = DataFormatter.generate_comparison_filename("unique_to", source2_name)
             unique_file2 = output_dir / unique_filename2
-            unique_mods2 = [mods2_dict[name] for name in unique_to_source2]
+            unique_mods2 = (mods2_dict[name] for name in unique_to_source2)
             self.file_io.write_csv_file(unique_file2, unique_mods2, include_source=True)
             print(f"✅ Unique mods from {source2_name} saved to: {unique_file2.name}")
 
@@ -925,14 +1101,12 @@ class ReportGenerator:
             source1_name, source2_name, comparison_data,
             include_size_columns=include_size_columns)
 
-        # Write common mods file
-        with open(common_mods_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for row in sorted(common_mods_data, key=lambda x: x['Mod Name']):
-                # Add Size (Bytes) column
-                row['Size (Bytes)'] = size_to_bytes(row.get('Size', ''))
-                writer.writerow(row)
+        # Write common mods file: build the CSV in memory and write it in one call
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(sorted(common_mods_data, key=itemgetter('Mod Name')))
+        common_mods_file.write_text(buffer.getvalue(), encoding='utf-8', newline='')
 
         # Write unique files
         self.write_unique_files(output_dir, source1_name, source2_name, unique_to_source1, unique_to_source2, mods1_dict, mods2_dict)
@@ -948,12 +1122,14 @@ class ModListManager:
     """Main orchestrator class that coordinates all components."""
 
     def __init__(self, verbose: bool = False, api_base_url: str = "https://api.battlemetrics.com", 
-                 workshop_base_url: str = "https://reforger.armaplatform.com/workshop"):
+                 workshop_base_url: str = "https://reforger.armaplatform.com/workshop",
+                 workshop_cache_file: Optional[Path] = WorkshopEnrichment.DEFAULT_CACHE_FILE):
         self.verbose = verbose
         self.file_io = FileIOHandler(verbose)
         self.http_client = HTTPClient(verbose)
         self.battlemetrics_api = BattleMetricsAPI(self.http_client, api_base_url)
-        self.workshop_enrichment = WorkshopEnrichment(self.http_client, workshop_base_url)
+        self.workshop_enrichment = WorkshopEnrichment(self.http_client, workshop_base_url,
+                                                      cache_file=workshop_cache_file)
         self.mod_comparison = ModComparison(self.file_io)
         self.report_generator = ReportGenerator(self.file_io)
 
@@ -974,9 +1150,10 @@ class ModListManager:
         Returns:
             Dictionary with comparison results
         """
-        # Convert to dictionaries for easier comparison
-        mods1_dict = {mod.name: mod for mod in mods1}
-        mods2_dict = {mod.name: mod for mod in mods2}
+        # Convert to dictionaries for easier comparison (names extracted by C-level attrgetter)
+        get_name = attrgetter('name')
+        mods1_dict = dict(zip(map(get_name, mods1), mods1))
+        mods2_dict = dict(zip(map(get_name, mods2), mods2))
 
         print(f"Source 1 ({source1_name}) contains {len(mods1_dict)} mods")
         print(f"Source 2 ({source2_name}) contains {len(mods2_dict)} mods")
@@ -1004,7 +1181,7 @@ class ModListManager:
         # Generate output files
         if output_dir:
             output_dir = Path(output_dir)
-            output_dir.mkdir(exist_ok=True)
+            output_dir.mkdir(parents=True, exist_ok=True)
 
             # Generate comparison files with appropriate level of detail
             self.report_generator.generate_comparison_files(source1_name, source2_name, output_dir,
@@ -1069,6 +1246,8 @@ Output files include timestamps for organization:
                        help='Base URL for BattleMetrics API (default: https://api.battlemetrics.com)')
     parser.add_argument('--workshop-base-url', default='https://reforger.armaplatform.com/workshop',
                        help='Base URL for workshop (default: https://reforger.armaplatform.com/workshop)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore the on-disk workshop cache and fetch every mod again')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose output')
 
@@ -1076,15 +1255,17 @@ Output files include timestamps for organization:
 
     manager = ModListManager(verbose=args.verbose, 
                            api_base_url=args.bmetrics_base_url,
-                           workshop_base_url=args.workshop_base_url)
+                           workshop_base_url=args.workshop_base_url,
+                           workshop_cache_file=None if args.no_cache else WorkshopEnrichment.DEFAULT_CACHE_FILE)
 
     try:
-        print("🔍 Comparing BattleMetrics servers:")
-        print(f"   Server 1: {args.server1_id}")
-        print(f"   Server 2: {args.server2_id}")
+        header = ["🔍 Comparing BattleMetrics servers:",
+                  f"   Server 1: {args.server1_id}",
+                  f"   Server 2: {args.server2_id}"]
         if args.enrich:
-            print("   🌐 Workshop enrichment: ENABLED")
-        print("=" * 80)
+            header.append("   🌐 Workshop enrichment: ENABLED")
+        header.append("=" * 80)
+        print("\n".join(header))
 
         # Fetch mod data from both servers using server IDs directly
         mods1, server1_name = manager.battlemetrics_api.fetch_mods_by_id(args.server1_id)
@@ -1109,24 +1290,24 @@ Output files include timestamps for organization:
         # Perform the comparison and generate all output files
         print("� Performing mod comparison and generating output files...")
         
-        # Use the output directory (now has a default of 'out/')
-        output_dir_for_files = args.output_dir
-        output_dir_for_files.mkdir(exist_ok=True)
+        # Use the output directory (now has a default of 'out/'), created once for all output files
+        output_dir = args.output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
 
         # Save individual server mod lists
         server1_filename = DataFormatter.generate_server_filename(server1_name, args.server1_id)
-        server1_file = output_dir_for_files / server1_filename
+        server1_file = output_dir / server1_filename
         manager.file_io.write_csv_file(server1_file, mods1, include_source=True)
         print(f"✅ Server {args.server1_id} ({server1_name}) mods saved to: {server1_file.name}")
 
         server2_filename = DataFormatter.generate_server_filename(server2_name, args.server2_id)
-        server2_file = output_dir_for_files / server2_filename
+        server2_file = output_dir / server2_filename
         manager.file_io.write_csv_file(server2_file, mods2, include_source=True)
         print(f"✅ Server {args.server2_id} ({server2_name}) mods saved to: {server2_file.name}")
         print()
 
         # Perform comparison and generate comparison files
-        manager.unified_comparison(mods1, mods2, server1_name, server2_name, args.output_dir, 
+        manager.unified_comparison(mods1, mods2, server1_name, server2_name, output_dir,
                                  show_enriched_output=args.enrich)
 
     except Exception as e: